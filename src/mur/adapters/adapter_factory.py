@@ -1,7 +1,7 @@
-import configparser
 import logging
 from pathlib import Path
 
+from ..core.murmurrc import load_murmurrc
 from ..utils.constants import DEFAULT_MURMUR_INDEX_URL
 from ..utils.error_handler import MurError
 from .base_adapter import RegistryAdapter
@@ -10,6 +10,9 @@ from .public_adapter import PublicRegistryAdapter
 
 logger = logging.getLogger(__name__)
 
+# Adapters keyed by (is private, index url, .murmurrc path, verbose), shared across commands
+_ADAPTER_CACHE: dict[tuple[bool, str, str, bool], RegistryAdapter] = {}
+
 
 def get_index_url_from_config(murmurrc_path: Path, verbose: bool = False) -> str:
     """Get the index-url from the .murmurrc configuration file.
@@ -25,18 +28,16 @@ def get_index_url_from_config(murmurrc_path: Path, verbose: bool = False) -> str
         MurError: If index-url is not found in the .murmurrc file
     """
     try:
-        config = configparser.ConfigParser()
-        config.read(murmurrc_path)
+        config = load_murmurrc(murmurrc_path)
 
-        if not config.has_section('murmur-nexus') or not config.has_option('murmur-nexus', 'index-url'):
+        index_url = config.get('murmur-nexus', {}).get('index-url')
+        if index_url is None:
             raise MurError(
                 code=213,
                 message='Missing registry configuration',
                 detail="No 'index-url' found in .murmurrc under [murmur-nexus] section.",
             )
 
-        index_url = config.get('murmur-nexus', 'index-url')
-
         # Validate URL format
         if not index_url.startswith('http'):
             raise MurError(
@@ -45,15 +46,13 @@ def get_index_url_from_config(murmurrc_path: Path, verbose: bool = False) -> str
 
         return index_url
 
-    except Exception as e:
-        if not isinstance(e, MurError):
-            raise MurError(
-                code=213,
-                message='Failed to read registry settings',
-                detail=f'Error reading registry configuration: {e!s}',
-                original_error=e,
-            )
-        raise
+    except (OSError, ValueError) as e:
+        raise MurError(
+            code=213,
+            message='Failed to read registry settings',
+            detail=f'Error reading registry configuration: {e!s}',
+            original_error=e,
+        )
 
 
 def verify_registry_settings(murmurrc_path: Path, verbose: bool = False) -> bool:
@@ -68,32 +67,25 @@ def verify_registry_settings(murmurrc_path: Path, verbose: bool = False) -> bool
 
     Returns:
         bool: True if a private registry is configured, False otherwise
-    """
-    try:
-        index_url = get_index_url_from_config(murmurrc_path, verbose)
 
-        # Return False if it matches default URL
-        if index_url == DEFAULT_MURMUR_INDEX_URL:
-            return False
+    Raises:
+        MurError: If the registry settings cannot be read
+    """
+    index_url = get_index_url_from_config(murmurrc_path, verbose)
 
-        return True
+    # Return False if it matches default URL
+    if index_url == DEFAULT_MURMUR_INDEX_URL:
+        return False
 
-    except MurError:
-        raise
-    except Exception as e:
-        raise MurError(
-            code=213,
-            message='Failed to verify registry settings',
-            detail=f'Error verifying registry configuration: {e!s}',
-            original_error=e,
-        )
+    return True
 
 
 def get_registry_adapter(murmurrc_path: Path, command_name: str, verbose: bool = False) -> RegistryAdapter:
     """Get the appropriate registry adapter based on environment.
 
     Determines whether to use a public or private registry adapter based on
-    the configuration in .murmurrc file.
+    the configuration in .murmurrc file. Adapters are reused for identical
+    settings so their clients and authentication state are shared.
 
     Args:
         murmurrc_path: Path to the .murmurrc file
@@ -111,11 +103,11 @@ def get_registry_adapter(murmurrc_path: Path, command_name: str, verbose: bool =
 
     omit_logging_commands = ['config']
 
-    if use_private:
-        if command_name not in omit_logging_commands:
-            print('Using private PyPI server')
-        return PrivateRegistryAdapter(verbose, index_url)
-
     if command_name not in omit_logging_commands:
-        print('Using public ∞ Murmur Nexus registry')
-    return PublicRegistryAdapter(verbose, index_url)
+        print('Using private PyPI server' if use_private else 'Using public ∞ Murmur Nexus registry')
+
+    cache_key = (use_private, index_url, str(murmurrc_path), verbose)
+    if (adapter := _ADAPTER_CACHE.get(cache_key)) is None:
+        adapter_class = PrivateRegistryAdapter if use_private else PublicRegistryAdapter
+        adapter = _ADAPTER_CACHE[cache_key] = adapter_class(verbose, index_url)
+    return adapter
@@ -1,8 +1,11 @@
 import logging
+import os
 from abc import ABC, abstractmethod
+from pathlib import Path
 from typing import Any
 
 from ..core.packaging import ArtifactManifest
+from ..utils.constants import GLOBAL_MURMURRC_PATH
 
 logger = logging.getLogger(__name__)
 
@@ -20,6 +23,11 @@ class RegistryAdapter(ABC):
     def __init__(self, verbose: bool = False, index_url: str | None = None):
         self.verbose = verbose
         self.index_url = index_url
+
+        # Resolve the .murmurrc to read once, preferring the project-local file
+        local_murmurrc = Path.cwd() / '.murmurrc'
+        self.murmurrc_path = local_murmurrc if os.path.isfile(local_murmurrc) else GLOBAL_MURMURRC_PATH
+
         if verbose:
             logger.setLevel(logging.DEBUG)
 
@@ -44,11 +52,11 @@ class RegistryAdapter(ABC):
         pass
 
     @abstractmethod
-    def get_artifact_indexes(self) -> list[str]:
-        """Get list of artifact index URLs for installation.
+    def get_artifact_indexes(self) -> tuple[str, ...]:
+        """Get artifact index URLs for installation.
 
         Returns:
-            list[str]: List of PyPI-compatible index URLs in priority order
+            tuple[str, ...]: PyPI-compatible index URLs in priority order
 
         Raises:
             NotImplementedError: This is an abstract method that must be implemented
@@ -1,15 +1,12 @@
-import configparser
 import logging
+import os
 from pathlib import Path
 from typing import Any
 
-from twine.commands.upload import upload
-from twine.settings import Settings
-
 from mur.core.packaging import ArtifactManifest
 
+from ..core.murmurrc import load_murmurrc
 from ..utils.constants import (
-    GLOBAL_MURMURRC_PATH,
     PYPI_PASSWORD,
     PYPI_USERNAME,
 )
@@ -18,6 +15,9 @@ from .base_adapter import RegistryAdapter
 
 logger = logging.getLogger(__name__)
 
+# Distribution file types uploaded for every published artifact
+UPLOAD_FILE_TYPES = ('wheel', 'source')
+
 
 class PrivateRegistryAdapter(RegistryAdapter):
     """Adapter for private PyPI registry instances.
@@ -37,6 +37,8 @@ class PrivateRegistryAdapter(RegistryAdapter):
             index_url (str | None, optional): URL of the private PyPI registry. Defaults to None.
         """
         super().__init__(verbose, index_url)
+        # Uploads go to the repository root rather than its /simple index
+        self.repository_url = index_url.rstrip('/').removesuffix('/simple') if index_url is not None else None
 
     def publish_artifact(
         self,
@@ -56,24 +58,20 @@ class PrivateRegistryAdapter(RegistryAdapter):
             MurError: If artifact file is not found (201) or if publishing fails (200).
         """
         try:
-            logger.debug(f'Publishing artifact: {manifest.to_dict()}')
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f'Publishing artifact: {manifest.to_dict()}')
 
-            # Check if index_url is None before using string methods
-            if self.index_url is None:
+            if self.repository_url is None:
                 raise MurError(213, 'No private registry URL configured')
 
-            repository_url = self.index_url.rstrip('/').replace('/simple', '')
-            response = {
+            return {
                 'status': 'pending',
                 'message': 'Ready for file upload',
                 'signed_upload_urls': [
-                    {'file_type': 'wheel', 'signed_url': repository_url},
-                    {'file_type': 'source', 'signed_url': repository_url},
+                    {'file_type': file_type, 'signed_url': self.repository_url} for file_type in UPLOAD_FILE_TYPES
                 ],
             }
 
-            return response
-
         except Exception as e:
             if isinstance(e, MurError):
                 raise
@@ -89,10 +87,14 @@ class PrivateRegistryAdapter(RegistryAdapter):
         Raises:
             MurError: If the file upload fails or the file doesn't exist.
         """
-        if not file_path.exists():
+        if not os.path.isfile(file_path):
             raise MurError(201, f'File not found: {file_path}')
 
         try:
+            # Imported lazily: twine is slow to import and only needed when uploading
+            from twine.commands.upload import upload
+            from twine.settings import Settings
+
             settings = Settings(
                 repository_url=signed_url,
                 sign=False,
@@ -112,44 +114,32 @@ class PrivateRegistryAdapter(RegistryAdapter):
         except Exception as e:
             raise MurError(200, f'Upload failed: {e!s}')
 
-    def get_artifact_indexes(self) -> list[str]:
+    def get_artifact_indexes(self) -> tuple[str, ...]:
         """Get artifact indexes from .murmurrc configuration file.
 
         Reads artifact index URLs from the .murmurrc configuration file, looking first
         for a local file in the current directory, then falling back to the global config.
 
         Returns:
-            list[str]: List of artifact index URLs with primary index first.
+            tuple[str, ...]: Artifact index URLs with primary index first.
 
         Raises:
             MurError: If no private registry URL is configured (807) or if reading configuration fails.
         """
         try:
-            # Get the path to the .murmurrc file
-            local_murmurrc = Path.cwd() / '.murmurrc'
-            murmurrc_path = local_murmurrc if local_murmurrc.exists() else GLOBAL_MURMURRC_PATH
+            config = load_murmurrc(self.murmurrc_path)
 
-            config = configparser.ConfigParser()
-            config.read(murmurrc_path)
+            # Extra index URLs from config, if present
+            extra_urls = config.get('murmur-nexus', {}).get('extra-index-url') or ''
+            extra_indexes = [url for url in map(str.strip, extra_urls.splitlines()) if url]
 
-            # Add extra index URLs from config if present
-            extra_indexes: list[str] = []
-            if config.has_option('murmur-nexus', 'extra-index-url'):
-                extra_urls = config.get('murmur-nexus', 'extra-index-url')
-                extra_indexes.extend(url.strip() for url in extra_urls.split('\n') if url.strip())
-
-            # Ensure index_url is not None before adding it to the list
+            # Ensure index_url is not None before adding it to the indexes
             if self.index_url is None:
                 raise MurError(807, 'No private registry URL configured')
 
-            indexes = [self.index_url]
-            indexes.extend(extra_indexes)
-
-            return indexes
+            return (self.index_url, *extra_indexes)
 
-        except Exception as e:
-            if isinstance(e, MurError):
-                raise
+        except (OSError, ValueError) as e:
             logger.warning(f'Failed to read .murmurrc config: {e}')
             raise MurError(
                 code=213,
@@ -1,21 +1,76 @@
-import configparser
 import logging
+import os
+import re
+import time
+from functools import cached_property
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any, BinaryIO
 
-import requests
 from requests.exceptions import RequestException
 
-from ..core.api_client import ApiClient
-from ..core.auth import AuthenticationManager
+from ..core.murmurrc import load_murmurrc
 from ..core.packaging import ArtifactManifest
-from ..utils.constants import GLOBAL_MURMURRC_PATH
+from ..utils.constants import MURMUR_SERVER_URL
 from ..utils.error_handler import MurError
 from ..utils.models import ArtifactPublishRequest, ArtifactPublishResponse
 from .base_adapter import RegistryAdapter
 
+if TYPE_CHECKING:
+    from ..core.api_client import ApiClient
+    from ..core.auth import AuthenticationManager
+
 logger = logging.getLogger(__name__)
 
+# How long authentication headers are reused before asking the auth manager again
+AUTH_HEADERS_TTL = 300
+
+# Known server error messages mapped to (error code, message, detail)
+SERVER_ERROR_MESSAGES: dict[str, tuple[int, str, str | None]] = {
+    'Token has expired': (504, 'Token has expired. Please log in again', 'Please run `mur logout` and try again.'),
+    'Could not validate credentials': (502, 'Could not validate credentials', None),
+    'The artifact or file already exists in the feed': (302, 'Artifact with version already exists', None),
+}
+
+# Connection failure messages raised by requests/urllib3
+NETWORK_ERROR_PATTERN = re.compile(r'Connection refused|Failed to resolve|nodename nor servname provided')
+
+# Standard HTTP status codes mapped to (error code, default message)
+STATUS_CODE_MAPPING: dict[int, tuple[int, str]] = {
+    400: (600, 'Bad request'),
+    401: (502, 'Unauthorized'),
+    403: (505, 'Permission denied'),
+    404: (600, 'Resource not found'),
+    500: (600, 'Server error'),
+    502: (806, 'Bad gateway'),
+    503: (804, 'Service unavailable'),
+}
+
+
+class _ProgressReader:
+    """File wrapper that reports read progress to a progress bar.
+
+    Lets requests stream the upload body in chunks while keeping the progress
+    bar in sync with the bytes actually sent.
+
+    Args:
+        file (BinaryIO): The open file to read from.
+        size (int): Total size of the file in bytes, used for Content-Length.
+        pbar (tqdm): Progress bar to update after each read.
+    """
+
+    def __init__(self, file: BinaryIO, size: int, pbar: Any):
+        self._file = file
+        self._size = size
+        self._pbar = pbar
+
+    def read(self, size: int = -1) -> bytes:
+        chunk = self._file.read(size)
+        self._pbar.update(len(chunk))
+        return chunk
+
+    def __len__(self) -> int:
+        return self._size
+
 
 class PublicRegistryAdapter(RegistryAdapter):
     """Adapter for the public Murmur registry.
@@ -30,9 +85,31 @@ class PublicRegistryAdapter(RegistryAdapter):
 
     def __init__(self, verbose: bool = False, index_url: str | None = None):
         super().__init__(verbose, index_url)
-        self.auth_manager = AuthenticationManager.create(verbose=verbose)
-        self.api_client = ApiClient(verbose=verbose)
-        self.base_url = self.api_client.base_url
+        self.base_url = MURMUR_SERVER_URL.rstrip('/')
+        self._cached_headers: dict[str, str] | None = None
+        self._headers_expiry: float = 0
+
+    @cached_property
+    def auth_manager(self) -> 'AuthenticationManager':
+        """Shared authentication manager, resolved on first use.
+
+        Returns:
+            AuthenticationManager: Manager used to obtain access tokens.
+        """
+        from ..core.auth import get_auth_manager
+
+        return get_auth_manager(verbose=self.verbose, base_url=self.base_url)
+
+    @cached_property
+    def api_client(self) -> 'ApiClient':
+        """API client for the registry, created on first use.
+
+        Returns:
+            ApiClient: Client used for registry API requests.
+        """
+        from ..core.api_client import ApiClient
+
+        return ApiClient(base_url=self.base_url, verbose=self.verbose)
 
     def publish_artifact(
         self,
@@ -51,7 +128,8 @@ class PublicRegistryAdapter(RegistryAdapter):
         Raises:
             MurError: If connection fails or server returns an error.
         """
-        logger.debug(f'Publishing artifact: {manifest.to_dict()}')
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f'Publishing artifact: {manifest.to_dict()}')
 
         try:
             # Create request payload from manifest
@@ -75,26 +153,33 @@ class PublicRegistryAdapter(RegistryAdapter):
             )
 
             if response.status_code != 200:
-                self._handle_error_response(response.status_code, response.error or 'Unknown error')
+                if response.status_code == 401:
+                    # Token was rejected, authenticate again on the next request
+                    self._cached_headers = None
+                # Prefer the structured 'detail' field so known errors resolve with a single lookup
+                detail = response.raw_data.get('detail') if isinstance(response.raw_data, dict) else None
+                error_message = detail if isinstance(detail, str) else response.error or 'Unknown error'
+                self._handle_error_response(response.status_code, error_message)
 
             return response.raw_data
 
         except RequestException as e:
-            if 'Connection refused' in str(e):
-                raise MurError(
-                    code=804,
-                    message='Failed to connect to server',
-                    detail=f'Connection refused. Is the server running at {self.base_url}?',
-                    original_error=e,
-                )
-            elif 'Failed to resolve' in str(e) or 'nodename nor servname provided' in str(e):
+            error_text = str(e)
+            if match := NETWORK_ERROR_PATTERN.search(error_text):
+                if match.group(0) == 'Connection refused':
+                    raise MurError(
+                        code=804,
+                        message='Failed to connect to server',
+                        detail=f'Connection refused. Is the server running at {self.base_url}?',
+                        original_error=e,
+                    )
                 raise MurError(
                     code=804,
                     message='Failed to resolve server hostname',
                     detail=f'{self.base_url}. Please check your network connection and DNS settings.',
                     original_error=e,
                 )
-            raise MurError(803, f'Connection error: {e!s}')
+            raise MurError(803, f'Connection error: {error_text}')
 
     def upload_file(self, file_path: Path, signed_url: str) -> None:
         """Upload a file to the registry using a signed URL.
@@ -106,41 +191,48 @@ class PublicRegistryAdapter(RegistryAdapter):
         Raises:
             MurError: If the file upload fails or the file doesn't exist.
         """
-        if not file_path.exists():
-            raise MurError(201, f'File not found: {file_path}')
-
         try:
             from tqdm import tqdm
 
-            file_size = file_path.stat().st_size
-
             with open(file_path, 'rb') as f:
+                file_size = os.fstat(f.fileno()).st_size
                 with tqdm(total=file_size, unit='B', unit_scale=True, desc=f'Uploading {file_path.name}') as pbar:
-                    data = f.read()
-                    pbar.update(file_size)
-
-                    response = requests.put(
-                        signed_url, data=data, headers={'Content-Type': 'application/octet-stream'}, timeout=300
+                    # Stream the body in chunks instead of loading the whole file into memory
+                    response = self.api_client.session.put(
+                        signed_url,
+                        data=_ProgressReader(f, file_size, pbar),
+                        headers={'Content-Type': 'application/octet-stream'},
+                        timeout=300,
                     )
 
             if not response.ok:
-                raise MurError(800, f'Failed to upload file: {response.text}')
+                raise MurError(800, f'Failed to upload file: HTTP {response.status_code} {response.text}'.rstrip())
 
+        except FileNotFoundError:
+            raise MurError(201, f'File not found: {file_path}')
         except RequestException as e:
             raise MurError(200, f'Upload failed: {e!s}')
 
     def _get_headers(self) -> dict[str, str]:
         """Get authentication headers for API requests.
 
+        Headers are cached on the adapter for AUTH_HEADERS_TTL seconds so that publishing
+        several artifacts does not re-read the credential cache for every request.
+
         Returns:
             dict[str, str]: Headers dictionary containing Bearer token.
 
         Raises:
             MurError: If authentication fails.
         """
+        if self._cached_headers is not None and time.monotonic() < self._headers_expiry:
+            return self._cached_headers
+
         try:
             access_token = self.auth_manager.authenticate()
-            return {'Authorization': f'Bearer {access_token}'}
+            self._cached_headers = {'Authorization': f'Bearer {access_token}'}
+            self._headers_expiry = time.monotonic() + AUTH_HEADERS_TTL
+            return self._cached_headers
         except MurError:
             raise
 
@@ -154,28 +246,14 @@ class PublicRegistryAdapter(RegistryAdapter):
         Raises:
             MurError: With appropriate error code and message based on the response.
         """
-        # Handle specific error messages
-        if 'Token has expired' in error_message:
-            raise MurError(
-                code=504,
-                message='Token has expired. Please log in again',
-                detail='Please run `mur logout` and try again.',
-            )
-        if 'Could not validate credentials' in error_message:
-            raise MurError(502, 'Could not validate credentials')
-        if 'The artifact or file already exists in the feed' in error_message:
-            raise MurError(302, 'Artifact with version already exists')
-
-        # Map standard HTTP status codes
-        STATUS_CODE_MAPPING = {
-            400: (600, 'Bad request'),
-            401: (502, 'Unauthorized'),
-            403: (505, 'Permission denied'),
-            404: (600, 'Resource not found'),
-            500: (600, 'Server error'),
-            502: (806, 'Bad gateway'),
-            503: (804, 'Service unavailable'),
-        }
+        # Handle specific error messages. Unstructured bodies are only scanned for client errors,
+        # server errors go straight to the status code mapping.
+        known_error = SERVER_ERROR_MESSAGES.get(error_message)
+        if known_error is None and status_code < 500:
+            known_error = next((v for k, v in SERVER_ERROR_MESSAGES.items() if k in error_message), None)
+        if known_error is not None:
+            code, message, detail = known_error
+            raise MurError(code=code, message=message, detail=detail)
 
         # Get error code and message, with fallback to generic server error
         error_code, default_message = STATUS_CODE_MAPPING.get(status_code, (800, 'Server error'))
@@ -185,39 +263,27 @@ class PublicRegistryAdapter(RegistryAdapter):
 
         raise MurError(error_code, error_detail)
 
-    def get_artifact_indexes(self) -> list[str]:
+    def get_artifact_indexes(self) -> tuple[str, ...]:
         """Get artifact indexes from .murmurrc configuration.
 
         Reads the primary index URL and any additional index URLs from the .murmurrc
         configuration file. Falls back to the default index if configuration cannot be read.
 
         Returns:
-            list[str]: List of artifact index URLs with primary index first.
+            tuple[str, ...]: Artifact index URLs with primary index first.
         """
         try:
-            # Get the path to the .murmurrc file
-            local_murmurrc = Path.cwd() / '.murmurrc'
-            murmurrc_path = local_murmurrc if local_murmurrc.exists() else GLOBAL_MURMURRC_PATH
+            config = load_murmurrc(self.murmurrc_path)
 
-            config = configparser.ConfigParser()
-            config.read(murmurrc_path)
-            extra_indexes: list[str] = []
-
-            # Add extra index URLs from config if present
-            if config.has_option('murmur-nexus', 'extra-index-url'):
-                extra_urls = config.get('murmur-nexus', 'extra-index-url')
-                extra_indexes.extend(url.strip() for url in extra_urls.split('\n') if url.strip())
+            # Extra index URLs from config, if present
+            extra_urls = config.get('murmur-nexus', {}).get('extra-index-url') or ''
+            extra_indexes = [url for url in map(str.strip, extra_urls.splitlines()) if url]
 
             # Ensure index_url is a string before adding to indexes
             primary_index = self.index_url if self.index_url is not None else ''
-            indexes = [primary_index]
-            indexes.extend(extra_indexes)
-
-            return indexes
+            return (primary_index, *extra_indexes)
 
-        except Exception as e:
-            if isinstance(e, MurError):
-                raise
+        except (OSError, ValueError) as e:
             logger.warning(f'Failed to read .murmurrc config: {e}')
             raise MurError(
                 code=213,
@@ -1,19 +1,24 @@
-import configparser
+import importlib.metadata
 import logging
 import os
+import subprocess
 import sys
 from pathlib import Path
+from typing import TYPE_CHECKING, ClassVar
 
 import click
-from ruamel.yaml import YAML
 
 from ..adapters.adapter_factory import get_index_url_from_config, get_registry_adapter
 from ..adapters.private_adapter import PrivateRegistryAdapter
-from ..core.auth import AuthenticationManager
+from ..core.auth import get_auth_manager
+from ..core.murmurrc import dump_murmurrc, load_murmurrc
 from ..core.packaging import ArtifactManifest, normalize_artifact_name
-from ..utils.constants import DEFAULT_MURMUR_EXTRA_INDEX_URLS, DEFAULT_MURMUR_INDEX_URL, GLOBAL_MURMURRC_PATH
+from ..utils.constants import DEFAULT_MURMUR_EXTRA_INDEX_URLS, DEFAULT_MURMUR_INDEX_URL, GLOBAL_MURMURRC_PATH, PIP_ENV
 from ..utils.error_handler import MurError
 
+if TYPE_CHECKING:
+    from ruamel.yaml import YAML
+
 logger = logging.getLogger(__name__)
 
 
@@ -24,6 +29,9 @@ class ArtifactCommand:
     including manifest management, authentication, and registry operations.
     """
 
+    # Round-trip YAML parser of each command class, set by the yaml property
+    _yaml: ClassVar['YAML']
+
     def __init__(self, command_name: str, verbose: bool = False) -> None:
         """Initialize artifact command.
 
@@ -40,10 +48,16 @@ class ArtifactCommand:
         self.command_name = command_name
         self.verbose = verbose
         self.scope: str | None = None
+        # Installed distributions by normalized name, built on first use
+        self._installed_by_norm: dict[str, importlib.metadata.Distribution] | None = None
 
-        # Initialize yaml and paths
+        # Info messages from this module are verbose-only, let the logger level filter them.
+        # Debug mode (MURMUR_DEBUG_MODE) keeps everything.
+        quiet = not verbose and not logging.getLogger().isEnabledFor(logging.DEBUG)
+        logger.setLevel(logging.WARNING if quiet else logging.NOTSET)
+
+        # Initialize paths
         self.current_dir = self.get_current_dir()
-        self.yaml = self._configure_yaml()
         self.murmurrc_path = self._get_murmurrc_path()
 
         # Follow the registry adapter flow
@@ -51,6 +65,60 @@ class ArtifactCommand:
         self.is_private_registry = isinstance(self.registry_adapter, PrivateRegistryAdapter)
         self.index_url = get_index_url_from_config(self.murmurrc_path, self.verbose)
 
+    def _installed_index(self) -> dict[str, importlib.metadata.Distribution]:
+        """Get the installed distributions, indexed by normalized name.
+
+        The environment is scanned once per command. Commands that change the environment
+        must update the index or reset `_installed_by_norm` to None.
+
+        Returns:
+            dict[str, importlib.metadata.Distribution]: Mapping of normalized name to installed distribution
+        """
+        if self._installed_by_norm is None:
+            self._installed_by_norm = {}
+            for dist in importlib.metadata.distributions():
+                # Earlier sys.path entries take precedence, as they do for imports
+                if name := dist.metadata['Name']:
+                    self._installed_by_norm.setdefault(normalize_artifact_name(name), dist)
+            logger.debug(f'Found {len(self._installed_by_norm)} installed distributions')
+        return self._installed_by_norm
+
+    def _run_pip(self, command: list[str]) -> None:
+        """Run a pip command.
+
+        In verbose mode pip's output is streamed to the log as it arrives. Otherwise stdout
+        is discarded and stderr is only shown when pip fails, so it does not interleave
+        with the spinner.
+
+        Args:
+            command: The pip command line to run
+
+        Raises:
+            subprocess.CalledProcessError: If pip exits with a non-zero status. Its stderr
+                holds pip's error output, merged with stdout in verbose mode.
+        """
+        if not self.verbose:
+            result = subprocess.run(  # nosec B603
+                command, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, check=False, env=PIP_ENV
+            )
+            if result.returncode != 0:
+                if result.stderr:
+                    click.echo(result.stderr, err=True, nl=False)
+                raise subprocess.CalledProcessError(result.returncode, command, stderr=result.stderr)
+            return
+
+        output_lines = []
+        with subprocess.Popen(  # nosec B603
+            command, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, bufsize=1, env=PIP_ENV
+        ) as process:
+            if process.stdout is not None:
+                for line in process.stdout:
+                    logger.info(line.rstrip())
+                    output_lines.append(line)
+        if process.returncode != 0:
+            output = ''.join(output_lines)
+            raise subprocess.CalledProcessError(process.returncode, command, output=output, stderr=output)
+
     def _get_murmurrc_path(self) -> Path:
         """Get the path to the .murmurrc file to use.
 
@@ -63,21 +131,17 @@ class ArtifactCommand:
         Returns:
             Path: Path to the .murmurrc file to use
         """
-        current_dir = Path.cwd()
-        local_murmurrc = current_dir / '.murmurrc'
+        local_murmurrc = Path.cwd() / '.murmurrc'
 
-        if local_murmurrc.exists():
-            if self.verbose:
-                logger.info(f'Using local configuration from {local_murmurrc}')
+        if os.path.isfile(local_murmurrc):
+            logger.info(f'Using local configuration from {local_murmurrc}')
             return local_murmurrc
 
-        if self.verbose:
-            logger.info(f'Using global configuration from {GLOBAL_MURMURRC_PATH}')
+        logger.info(f'Using global configuration from {GLOBAL_MURMURRC_PATH}')
 
-        if not GLOBAL_MURMURRC_PATH.exists():
-            if self.verbose:
-                logger.info('Global .murmurrc not found, you must be new around here!')
-                logger.info("Running 'mur config init --global' with default settings")
+        if not os.path.exists(GLOBAL_MURMURRC_PATH):
+            logger.info('Global .murmurrc not found, you must be new around here!')
+            logger.info("Running 'mur config init --global' with default settings")
             self._init_default_global_murmurrc()
 
         return GLOBAL_MURMURRC_PATH
@@ -95,17 +159,14 @@ class ArtifactCommand:
             config_path.parent.mkdir(parents=True, exist_ok=True)
 
             # Create new config with default settings
-            config = configparser.ConfigParser()
-            config['murmur-nexus'] = {
-                'index-url': DEFAULT_MURMUR_INDEX_URL,
-                'extra-index-url': ' '.join(DEFAULT_MURMUR_EXTRA_INDEX_URLS),
+            config = {
+                'murmur-nexus': {
+                    'index-url': DEFAULT_MURMUR_INDEX_URL,
+                    'extra-index-url': ' '.join(DEFAULT_MURMUR_EXTRA_INDEX_URLS),
+                },
             }
-
-            with open(config_path, 'w') as f:
-                config.write(f)
-
-            if self.verbose:
-                logger.info(f'Created global .murmurrc at: {config_path}')
+            config_path.write_text(dump_murmurrc(config), encoding='utf-8')
+            logger.info(f'Created global .murmurrc at: {config_path}')
 
         except Exception as e:
             raise MurError(code=405, message='Failed to create global .murmurrc', original_error=e)
@@ -125,21 +186,20 @@ class ArtifactCommand:
             FileNotFoundError: If .murmurrc file does not exist.
             ValueError: If index-url is not found in config.
         """
-        config = configparser.ConfigParser()
         if not os.path.exists(murmurrc_path):
             raise FileNotFoundError(f'{murmurrc_path} not found.')
-        config.read(murmurrc_path)
+        config = load_murmurrc(murmurrc_path)
 
-        index_url = config.get('murmur-nexus', 'index-url', fallback=None)
+        section = config.get('murmur-nexus', {})
+        index_url = section.get('index-url')
         if not index_url:
             raise ValueError("No 'index-url' found in .murmurrc under [murmur-nexus].")
 
-        # Get all extra-index-url values
+        # Get all extra-index-url values, handling both single and multiple entries
         extra_index_urls: list[str] = []
-        if config.has_option('murmur-nexus', 'extra-index-url'):
-            # Handle both single and multiple extra-index-url entries
-            extra_urls = config.get('murmur-nexus', 'extra-index-url')
-            extra_index_urls.extend(url.strip() for url in extra_urls.split('\n') if url.strip())
+        extra_urls = section.get('extra-index-url')
+        if extra_urls:
+            extra_index_urls.extend(url for url in map(str.strip, extra_urls.splitlines()) if url)
 
         return index_url, extra_index_urls
 
@@ -204,7 +264,24 @@ class ArtifactCommand:
             return artifact_name[len(scope_prefix) :]
         return artifact_name
 
-    def _configure_yaml(self) -> YAML:
+    @property
+    def yaml(self) -> 'YAML':
+        """Round-trip YAML parser, configured once per command class on first use.
+
+        The CLI runs a single command per process, so instances of a command class
+        share one parser instead of each building their own.
+
+        Returns:
+            YAML: Configured YAML parser with specific formatting settings.
+        """
+        cls = type(self)
+        yaml = cls.__dict__.get('_yaml')
+        if yaml is None:
+            yaml = self._configure_yaml()
+            cls._yaml = yaml
+        return yaml
+
+    def _configure_yaml(self) -> 'YAML':
         """Configure YAML parser settings.
 
         Configures a YAML parser with specific formatting settings for consistent
@@ -213,6 +290,8 @@ class ArtifactCommand:
         Returns:
             YAML: Configured YAML parser with specific formatting settings.
         """
+        from ruamel.yaml import YAML
+
         yaml = YAML()
         yaml.default_flow_style = False
         yaml.explicit_start = False
@@ -254,7 +333,7 @@ class ArtifactCommand:
             MurError: If authentication fails
         """
         # Get the auth manager from the registry adapter
-        auth_manager = AuthenticationManager.create(verbose=self.verbose)
+        auth_manager = get_auth_manager(verbose=self.verbose)
 
         if not auth_manager.is_authenticated():
             raise MurError(
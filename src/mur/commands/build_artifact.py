@@ -1,18 +1,103 @@
+import contextlib
+import io
 import logging
+import os
 import re
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import click
 
 from ..core.config import ConfigManager
 from ..core.packaging import ArtifactBuilder, is_valid_artifact_name_version, normalize_artifact_name
+from ..utils.constants import VALID_ARTIFACT_TYPES
 from ..utils.error_handler import MurError
 from ..utils.loading import Spinner
 from .base import ArtifactCommand
 
 logger = logging.getLogger(__name__)
 
+# pyproject.toml layout; optional fields are filled with '' when the manifest does not set them
+PYPROJECT_TEMPLATE = (
+    '[build-system]\n'
+    'requires = ["hatchling<=1.26.3"]  # pypiserver 2.3.2 requires hatchling metadata version up to version 2.3\n'
+    'build-backend = "hatchling.build"\n'
+    '\n'
+    '[project]\n'
+    'name = "{name}"\n'
+    'version = "{version}"\n'
+    '{description}{requires_python}{authors}{license}'
+    'classifiers = [\n'
+    '    "Programming Language :: Python",\n'
+    '    "Programming Language :: Python :: 3",\n'
+    '    "Programming Language :: Python :: 3 :: Only",\n'
+    '    "Intended Audience :: Developers",\n'
+    '    "Intended Audience :: Information Technology",\n'
+    '    "Intended Audience :: System Administrators",\n'
+    '{license_classifier}'
+    '    "Topic :: Software Development :: Libraries :: Python Modules",\n'
+    '    "Topic :: Scientific/Engineering :: Artificial Intelligence",\n'
+    ']\n'
+    'readme = "README.md"\n'
+    'requires_dist = [{dependencies}]\n'
+    '{urls}'
+    '\n'
+    '[tool.hatch.build.targets.wheel]\n'
+    'packages = ["src/murmur"]'
+)
+
+# One requires_dist entry
+DEPENDENCY_LINE = '\n    "{}",'
+
+# Project URL types copied from the manifest metadata into [project.urls]
+VALID_URL_TYPES = frozenset({'repository', 'documentation', 'project'})
+
+# Manifest keys kept in the artifact's generated murmur-build.yaml
+ALLOWED_MANIFEST_KEYS = frozenset({'name', 'version', 'type', 'description', 'dependencies', 'metadata'})
+ALLOWED_AGENT_MANIFEST_KEYS = ALLOWED_MANIFEST_KEYS | {'instructions'}
+
+
+def _write_file(path: Path, content: str = '') -> None:
+    """Write a small generated file atomically without going through the buffered text IO stack.
+
+    The content goes to a temporary file next to the target, which then replaces
+    it, so an interrupted build never leaves a truncated file behind.
+
+    Args:
+        path: File to create or replace
+        content: Text to write, encoded as UTF-8
+    """
+    tmp_path = path.with_name(f'{path.name}.tmp')
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+    try:
+        try:
+            data = memoryview(content.encode())
+            while data:
+                data = data[os.write(fd, data) :]
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, path)
+    except BaseException:
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(tmp_path)
+        raise
+
+
+def _mkdir_if_missing(path: Path) -> None:
+    """Create a directory, creating missing parents only when they do not exist.
+
+    Args:
+        path: Directory to create
+    """
+    try:
+        os.mkdir(path)
+    except FileExistsError:
+        if not os.path.isdir(path):
+            raise
+    except FileNotFoundError:
+        path.mkdir(parents=True, exist_ok=True)
+
 
 class BuildCommand(ArtifactCommand):
     """Handles artifact building.
@@ -41,7 +126,6 @@ class BuildCommand(ArtifactCommand):
         """
         try:
             super().__init__('build', verbose)
-            self.verbose = verbose
             self.scope = scope  # update scope in parent
 
             # Load and validate manifest
@@ -101,7 +185,7 @@ class BuildCommand(ArtifactCommand):
         Raises:
             MurError: If the artifact type is invalid
         """
-        if artifact_type not in ['agent', 'tool']:
+        if artifact_type not in VALID_ARTIFACT_TYPES:
             raise MurError(
                 code=207,
                 message=f"Invalid artifact type '{artifact_type}'",
@@ -120,20 +204,33 @@ class BuildCommand(ArtifactCommand):
             MurError: If manifest file is missing or invalid YAML.
         """
         manifest_file = self.current_dir / 'murmur-build.yaml'
-        if not manifest_file.exists():
+        try:
+            # Round-trip load keeps scalar styles such as block 'instructions' for the filtered copy
+            with open(manifest_file) as f:
+                return self.yaml.load(f)
+        except FileNotFoundError:
             raise MurError(
                 code=201,
                 message='murmur-build.yaml not found',
                 detail='The murmur-build.yaml manifest file was not found in the current directory',
             )
-
-        try:
-            with open(manifest_file) as f:
-                return self.yaml.load(f)
         except Exception as e:
             raise MurError(code=205, message='Failed to load murmur-build.yaml', original_error=e)
 
-    def _create_directory_structure(self, artifact_path: Path) -> None:
+    def _get_package_entry_path(self, artifact_path: Path) -> Path:
+        """Get the artifact's package directory inside the murmur namespace.
+
+        Args:
+            artifact_path (Path): Root path for new artifact.
+
+        Returns:
+            Path: The src/murmur/artifacts/<scope>_<name> directory of the artifact.
+        """
+        artifact_name = artifact_path.name
+        package_name = f'{self.scope}_{artifact_name}' if self.scope else artifact_name
+        return artifact_path / 'src' / 'murmur' / 'artifacts' / package_name
+
+    def _create_directory_structure(self, artifact_path: Path, package_entry_path: Path) -> None:
         """Create the artifact directory structure.
 
         Creates the necessary artifact directories and files for the artifact,
@@ -143,6 +240,7 @@ class BuildCommand(ArtifactCommand):
 
         Args:
             artifact_path (Path): Root path for new artifact.
+            package_entry_path (Path): The artifact's package directory in the murmur namespace.
 
         Raises:
             MurError: If directory creation fails, required files are missing,
@@ -150,40 +248,41 @@ class BuildCommand(ArtifactCommand):
         """
         try:
             # Create murmur namespace artifact structure
-            src_path = artifact_path / 'src' / 'murmur' / 'artifacts'
-            src_path.mkdir(parents=True, exist_ok=True)
-
             artifact_name = artifact_path.name
-            artifact_path = Path(f'{self.scope}_{artifact_name}' if self.scope else artifact_name)
-            namespace_path = src_path / artifact_path
-            namespace_path.mkdir(parents=True, exist_ok=True)
+            _mkdir_if_missing(package_entry_path)
 
             # Create an empty __init__.py
-            with open(namespace_path / '__init__.py', 'w') as f:
-                pass
+            _write_file(package_entry_path / '__init__.py')
 
-            logger.debug(f'Created directory structure at {artifact_path}')
+            logger.debug(f'Created directory structure at {package_entry_path}')
 
             # Handle source files
-            if (self.current_dir / 'src').exists():
-                src_files = list((self.current_dir / 'src').glob('*.py'))
-                if src_files and not (self.current_dir / 'src' / 'main.py').exists():
-                    raise MurError(
-                        code=201,
-                        message='main.py is missing',
-                        detail='Source files found but main.py is missing. main.py is required as the default entry point.',
-                    )
-                elif (main_file := self.current_dir / 'src' / 'main.py').exists():
-                    shutil.copy(main_file, namespace_path)
-                    if self.verbose:
-                        logger.info('Copying source files...')
-                    logger.debug(f'Copied main.py to {namespace_path}')
+            src_dir = self.current_dir / 'src'
+            main_file = src_dir / 'main.py'
+            if os.path.isfile(main_file):
+                # copyfile skips the permission-bit copy that shutil.copy does
+                shutil.copyfile(main_file, package_entry_path / 'main.py')
+                if self.verbose:
+                    logger.info('Copying source files...')
+                logger.debug(f'Copied main.py to {package_entry_path}')
             else:
-                # Create default main.py if no source files exist
-                with open(namespace_path / 'main.py', 'w') as f:
-                    f.write('from murmur.build import ActivateAgent\n\n')
-                    f.write(f"{artifact_name} = ActivateAgent('{artifact_name}')\n")
-                logger.debug(f'Created default main.py with {artifact_name} function')
+                try:
+                    with os.scandir(src_dir) as entries:
+                        has_src_files = any(entry.name.endswith('.py') for entry in entries)
+                except FileNotFoundError:
+                    # Create default main.py if no source files exist
+                    _write_file(
+                        package_entry_path / 'main.py',
+                        f"from murmur.build import ActivateAgent\n\n{artifact_name} = ActivateAgent('{artifact_name}')\n",
+                    )
+                    logger.debug(f'Created default main.py with {artifact_name} function')
+                else:
+                    if has_src_files:
+                        raise MurError(
+                            code=201,
+                            message='main.py is missing',
+                            detail='Source files found but main.py is missing. main.py is required as the default entry point.',
+                        )
 
         except Exception as e:
             raise MurError(code=209, message='Failed to create directory structure', original_error=e)
@@ -202,12 +301,13 @@ class BuildCommand(ArtifactCommand):
         """
         try:
             # Create README.md
-            with open(artifact_path / 'README.md', 'w') as f:
-                f.write(f"# {self.build_manifest['name']}\n\n{self.build_manifest.get('description', '')}")
+            _write_file(
+                artifact_path / 'README.md',
+                f"# {self.build_manifest['name']}\n\n{self.build_manifest.get('description', '')}",
+            )
 
             # Create pyproject.toml
-            with open(artifact_path / 'pyproject.toml', 'w') as f:
-                f.write(self._generate_pyproject_toml())
+            _write_file(artifact_path / 'pyproject.toml', self._generate_pyproject_toml())
 
             logger.debug('Created project files')
             if self.verbose:
@@ -219,37 +319,14 @@ class BuildCommand(ArtifactCommand):
     def _generate_pyproject_toml(self) -> str:
         """Generate pyproject.toml content.
 
-        Combines all project configuration sections into a complete pyproject.toml file.
+        Fills PYPROJECT_TEMPLATE in one pass; optional fields render as empty strings
+        when the manifest does not set them.
 
         Returns:
             str: Complete content for pyproject.toml file.
-        """
-        content = []
-        content.extend(self._generate_build_system())
-        content.extend(self._generate_project_section())
-        content.extend(self._generate_project_urls())
-        content.extend(self._generate_build_targets())
-        return '\n'.join(content)
-
-    def _generate_build_system(self) -> list[str]:
-        """Generate build-system section.
-
-        Returns:
-            list[str]: Lines for the build-system section of pyproject.toml.
-        """
-        return [
-            '[build-system]',
-            'requires = ["hatchling<=1.26.3"]  # pypiserver 2.3.2 requires hatchling metadata version up to version 2.3',
-            'build-backend = "hatchling.build"',
-            '',
-        ]
-
-    def _generate_project_section(self) -> list[str]:
-        """Generate project section including metadata.
 
-        Returns:
-            list[str]: Lines for the project section of pyproject.toml, including
-                name, version, description, and other metadata.
+        Raises:
+            MurError: If no scope is set when building for the public registry.
         """
         if not self.is_private_registry and not self.scope:
             raise MurError(
@@ -257,131 +334,47 @@ class BuildCommand(ArtifactCommand):
                 message='No scope set',
                 detail="A scope is required for publishing to the public registry. Please run 'mur login' first.",
             )
+        build_manifest = self.build_manifest
+        metadata = build_manifest.get('metadata') or {}
         prefix = f'{self.scope}-' if not self.is_private_registry else ''
-        artifact_name = f'{prefix}{self.build_manifest["name"]}'.lower()
-        content = [
-            '[project]',
-            f'name = "{artifact_name}"',
-            f'version = "{self.build_manifest["version"]}"',
-        ]
-
-        metadata = self.build_manifest.get('metadata', {})
-
-        # Add optional fields
-        if description := self.build_manifest.get('description'):
-            content.append(f'description = "{description}"')
-
-        if requires_python := metadata.get('requires_python'):
-            content.append(f'requires-python = "{requires_python}"')
-
-        # Add author information
-        content.extend(self._generate_authors(metadata))
-
-        # Add license
-        if license_type := metadata.get('license'):
-            content.append(f'license = {{text = "{license_type}"}}')
-
-        # Add classifiers
-        content.extend(self._generate_classifiers(license_type))
-        content.append('readme = "README.md"')
-
-        # Add dependencies
-        content.extend(self._generate_dependencies())
-
-        return content
-
-    def _generate_authors(self, metadata: dict) -> list[str]:
-        """Generate authors section if author info exists.
-
-        Creates the authors section of pyproject.toml based on provided metadata.
-
-        Args:
-            metadata (dict): Dictionary containing author metadata including 'author'
-                and optional 'email' fields.
-
-        Returns:
-            list[str]: Lines for the authors section of pyproject.toml.
-        """
-        if author := metadata.get('author'):
-            email = metadata.get('email', '')
-            author_line = '{name = "' + author + '"'
-            if email:
-                author_line += f', email = "{email}"'
-            author_line += '}'
-            return ['authors = [', f'    {author_line}', ']']
-        return []
-
-    def _generate_classifiers(self, license_type: str | None) -> list[str]:
-        """Generate classifiers section.
-
-        Args:
-            license_type: Type of license for the project, if any.
-
-        Returns:
-            list[str]: Lines for the classifiers section of pyproject.toml.
-        """
-        classifiers = [
-            'classifiers = [',
-            '    "Programming Language :: Python",',
-            '    "Programming Language :: Python :: 3",',
-            '    "Programming Language :: Python :: 3 :: Only",',
-            '    "Intended Audience :: Developers",',
-            '    "Intended Audience :: Information Technology",',
-            '    "Intended Audience :: System Administrators",',
-        ]
-
-        if license_type:
-            classifiers.append(f'    "License :: OSI Approved :: {license_type} License",')
-
-        classifiers.extend(
-            [
-                '    "Topic :: Software Development :: Libraries :: Python Modules",',
-                '    "Topic :: Scientific/Engineering :: Artificial Intelligence",',
-                ']',
-            ]
-        )
-        return classifiers
-
-    def _generate_dependencies(self) -> list[str]:
-        """Generate dependencies section.
-
-        Returns:
-            list[str]: Lines for the dependencies section of pyproject.toml.
-        """
-        if dependencies := self.build_manifest.get('dependencies', []):
-            return ['requires_dist = [', *[f'    "{dep}",' for dep in dependencies], ']']
-        return ['requires_dist = []']
-
-    def _generate_project_urls(self) -> list[str]:
-        """Generate project.urls section.
-
-        Returns:
-            list[str]: Lines for the project.urls section of pyproject.toml.
-        """
-        valid_url_types = {'repository', 'documentation', 'project'}
-        urls = self.build_manifest.get('metadata', {}).get('urls', {})
+        artifact_name = f'{prefix}{build_manifest["name"]}'.lower()
+
+        description = build_manifest.get('description')
+        requires_python = metadata.get('requires_python')
+        author = metadata.get('author')
+        email = metadata.get('email', '')
+        email_field = f', email = "{email}"' if email else ''
+        license_type = metadata.get('license')
+        dependencies = build_manifest.get('dependencies', [])
+
+        # Keep only the first URL of each supported type
+        urls = metadata.get('urls') or {}
         valid_urls = {
-            url_type: url_list[0] for url_type, url_list in urls.items() if url_type in valid_url_types and url_list
+            url_type: url_list[0] for url_type, url_list in urls.items() if url_type in VALID_URL_TYPES and url_list
         }
 
-        if not valid_urls:
-            return []
-
-        content = ['', '[project.urls]']
-        for url_type, url in valid_urls.items():
-            title = url_type.capitalize()
-            content.append(f'{title} = "{url}"')
-        return content
-
-    def _generate_build_targets(self) -> list[str]:
-        """Generate build targets section.
-
-        Returns:
-            list[str]: Lines for the build targets section of pyproject.toml.
-        """
-        return ['', '[tool.hatch.build.targets.wheel]', 'packages = ["src/murmur"]']
+        return PYPROJECT_TEMPLATE.format_map(
+            {
+                'name': artifact_name,
+                'version': build_manifest['version'],
+                'description': f'description = "{description}"\n' if description else '',
+                'requires_python': f'requires-python = "{requires_python}"\n' if requires_python else '',
+                'authors': f'authors = [\n    {{name = "{author}"{email_field}}}\n]\n' if author else '',
+                'license': f'license = {{text = "{license_type}"}}\n' if license_type else '',
+                'license_classifier': f'    "License :: OSI Approved :: {license_type} License",\n'
+                if license_type
+                else '',
+                'dependencies': ''.join(map(DEPENDENCY_LINE.format, dependencies)) + '\n' if dependencies else '',
+                'urls': (
+                    '\n[project.urls]\n'
+                    + ''.join(f'{url_type.capitalize()} = "{url}"\n' for url_type, url in valid_urls.items())
+                    if valid_urls
+                    else ''
+                ),
+            }
+        )
 
-    def _write_filtered_build_manifest(self, artifact_name: Path) -> None:
+    def _write_filtered_build_manifest(self, package_entry_path: Path) -> None:
         """Filter and write configuration to murmur-build.yaml.
 
         Writes a filtered version of the configuration to the artifact's
@@ -389,28 +382,21 @@ class BuildCommand(ArtifactCommand):
         artifact type. For agents, this includes the 'instructions' key.
 
         Args:
-            artifact_name (Path): Path to new artifact.
+            package_entry_path (Path): The artifact's package directory in the murmur namespace.
 
         Raises:
             MurError: If writing config fails.
         """
-        # Base allowed keys for all artifact types
-        allowed_keys = {'name', 'version', 'type', 'description', 'dependencies', 'metadata'}
-
-        # Add instructions key only for agent type
-        if self.artifact_type == 'agent':
-            allowed_keys.add('instructions')
+        # Agents additionally keep their 'instructions'
+        allowed_keys = ALLOWED_AGENT_MANIFEST_KEYS if self.artifact_type == 'agent' else ALLOWED_MANIFEST_KEYS
 
         filtered_config = {k: v for k, v in self.build_manifest.items() if k in allowed_keys}
 
-        name = f'{self.scope}_{artifact_name.name}' if self.scope is not None else artifact_name.name
-
-        artifact_entry_path = artifact_name / 'src' / 'murmur' / 'artifacts' / name
-
         try:
-            with open(artifact_entry_path / 'murmur-build.yaml', 'w') as f:
-                f.write('# This file is automatically generated based on murmur-build.yaml in the parent directory\n')
-                self.yaml.dump(filtered_config, f)
+            buf = io.StringIO()
+            buf.write('# This file is automatically generated based on murmur-build.yaml in the parent directory\n')
+            self.yaml.dump(filtered_config, buf)
+            _write_file(package_entry_path / 'murmur-build.yaml', buf.getvalue())
 
             logger.debug(f'Written config keys to murmur-build.yaml: {list(filtered_config.keys())}')
         except Exception as e:
@@ -451,28 +437,31 @@ class BuildCommand(ArtifactCommand):
             artifact_name = normalize_artifact_name(self.build_manifest['name'])
             artifact_path = self.current_dir / artifact_name
 
-            if artifact_path.exists():
+            if os.path.isdir(artifact_path):
                 logger.info(
                     f"The {self.artifact_type} '{artifact_name}' has already been built in this directory. "
                     f'To rebuild, please remove the existing {artifact_name} directory first.'
                 )
                 return
 
-            spinner = Spinner()
-            try:
+            with Spinner() as spinner:
                 if not (self.verbose or logger.getEffectiveLevel() <= logging.DEBUG):
                     spinner.start(f'Building {self.artifact_type} {artifact_name}')
 
                 # Build artifact
-                self._create_directory_structure(artifact_path)
-                self._create_project_files(artifact_path)
-                self._write_filtered_build_manifest(artifact_path)
+                package_entry_path = self._get_package_entry_path(artifact_path)
+                self._create_directory_structure(artifact_path, package_entry_path)
+
+                # Project files and the filtered manifest go to disjoint paths, write them concurrently
+                with ThreadPoolExecutor(max_workers=2) as executor:
+                    futures = [
+                        executor.submit(self._create_project_files, artifact_path),
+                        executor.submit(self._write_filtered_build_manifest, package_entry_path),
+                    ]
+                    for future in futures:
+                        future.result()
                 self._build_artifact(artifact_path)
 
-            finally:
-                if not (self.verbose or logger.getEffectiveLevel() <= logging.DEBUG):
-                    spinner.stop()
-
             self.log_success(
                 f"Successfully built {self.artifact_type} "
                 f"{self.build_manifest['name']} {self.build_manifest['version']}"
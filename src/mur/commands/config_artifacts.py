@@ -1,10 +1,13 @@
-import configparser
+import contextlib
 import logging
+import os
+import stat
 from pathlib import Path
-from typing import Optional
+from typing import ClassVar, Optional
 
 import click
 
+from ..core.murmurrc import MurmurrcConfig, dump_murmurrc, load_murmurrc
 from ..utils.constants import DEFAULT_MURMUR_EXTRA_INDEX_URLS, DEFAULT_MURMUR_INDEX_URL, GLOBAL_MURMURRC_PATH
 from ..utils.error_handler import MurError
 from .base import ArtifactCommand
@@ -23,6 +26,9 @@ class ConfigCommand(ArtifactCommand):
     Local settings take precedence when present.
     """
 
+    # Parsed .murmurrc files by path, with the (mtime_ns, size) signature they were read or written at
+    _configs: ClassVar[dict[Path, tuple[tuple[int, int] | None, MurmurrcConfig]]] = {}
+
     def __init__(self, verbose: bool = False) -> None:
         """Initialize config command.
 
@@ -42,24 +48,64 @@ class ConfigCommand(ArtifactCommand):
         self.global_config_path = GLOBAL_MURMURRC_PATH
         self.local_config_path = Path.cwd() / '.murmurrc'
 
-    def _load_config(self, path: Path) -> configparser.ConfigParser:
+    def _load_config(self, path: Path) -> MurmurrcConfig:
         """Load configuration from .murmurrc file.
 
+        The parsed configuration is kept for the rest of the process and reused
+        as long as the file's mtime and size are unchanged.
+
         Args:
             path: Path to .murmurrc file
 
         Returns:
-            Loaded configuration
+            Loaded configuration, safe to modify
         """
-        config = configparser.ConfigParser()
-        if path.exists():
-            config.read(path)
-        if PUBLIC_CONFIG_SECTION not in config:
-            config[PUBLIC_CONFIG_SECTION] = {}
-        if PRIVATE_CONFIG_SECTION not in config:
-            config[PRIVATE_CONFIG_SECTION] = {}
+        try:
+            st = os.stat(path)
+            signature: tuple[int, int] | None = (st.st_mtime_ns, st.st_size)
+        except FileNotFoundError:
+            signature = None
+
+        cached = self._configs.get(path)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+
+        # load_murmurrc shares its result between callers, copy before modifying
+        config = {section: dict(values) for section, values in load_murmurrc(path).items()}
+        config.setdefault(PUBLIC_CONFIG_SECTION, {})
+        config.setdefault(PRIVATE_CONFIG_SECTION, {})
+        self._configs[path] = (signature, config)
         return config
 
+    def _flush_config(self, path: Path, config: MurmurrcConfig) -> None:
+        """Write configuration to a .murmurrc file atomically.
+
+        The configuration is written to a temporary file next to the target and
+        moved into place, so an interrupted write never leaves a truncated file.
+        Symlinks are followed and the permissions of an existing file are kept.
+
+        Args:
+            path: Path to .murmurrc file
+            config: Configuration to write
+        """
+        target = Path(os.path.realpath(path))
+        tmp_path = target.with_name(f'{target.name}.{os.getpid()}.tmp')
+        try:
+            with open(tmp_path, 'x', encoding='utf-8') as f:
+                f.write(dump_murmurrc(config))
+            with contextlib.suppress(FileNotFoundError):
+                os.chmod(tmp_path, stat.S_IMODE(os.stat(target).st_mode))
+            os.replace(tmp_path, target)
+        except BaseException:
+            # Neither the file nor the cached parse can be trusted to match anymore
+            self._configs.pop(path, None)
+            with contextlib.suppress(FileNotFoundError):
+                os.unlink(tmp_path)
+            raise
+
+        st = os.stat(target)
+        self._configs[path] = ((st.st_mtime_ns, st.st_size), config)
+
     def _get_section(self, section_type: str) -> str:
         """Get the appropriate config section based on type.
 
@@ -103,10 +149,9 @@ class ConfigCommand(ArtifactCommand):
 
             config_path.parent.mkdir(parents=True, exist_ok=True)
             config = self._load_config(config_path)
-            config[section][key] = value
-
-            with open(config_path, 'w') as f:
-                config.write(f)
+            # Keys are case-insensitive and stored lowercased, like ConfigParser did
+            config[section][key.lower()] = value
+            self._flush_config(config_path, config)
 
             self.log_success(f'Set {section_type}.{key}={value} in {scope} .murmurrc')
 
@@ -128,19 +173,11 @@ class ConfigCommand(ArtifactCommand):
         try:
             section = self._get_section(section_type)
 
-            # Check local first if it exists
-            if self.local_config_path.exists():
-                local_config = self._load_config(self.local_config_path)
-                if key in local_config[section]:
-                    value = local_config[section][key]
-                    click.echo(f'{value}')
-                    return value
-
-            # Fall back to global
-            if self.global_config_path.exists():
-                global_config = self._load_config(self.global_config_path)
-                if key in global_config[section]:
-                    value = global_config[section][key]
+            # Check local first, fall back to global. Missing files read as empty and
+            # unchanged files are not parsed again.
+            for config_path in (self.local_config_path, self.global_config_path):
+                values = load_murmurrc(config_path).get(section, {})
+                if (value := values.get(key.lower())) is not None:
                     click.echo(f'{value}')
                     return value
 
@@ -157,9 +194,9 @@ class ConfigCommand(ArtifactCommand):
             MurError: If configs cannot be read
         """
         try:
-            # Load both configs
-            global_config = self._load_config(self.global_config_path)
-            local_config = self._load_config(self.local_config_path)
+            # Load both configs, reusing earlier parses of unchanged files
+            global_config = load_murmurrc(self.global_config_path)
+            local_config = load_murmurrc(self.local_config_path)
 
             has_values = False
 
@@ -181,7 +218,7 @@ class ConfigCommand(ArtifactCommand):
         except Exception as e:
             raise MurError(code=403, message='Failed to list configurations', original_error=e)
 
-    def _display_config_section(self, config: configparser.ConfigParser, header: str, path: Path) -> bool:
+    def _display_config_section(self, config: MurmurrcConfig, header: str, path: Path) -> bool:
         """Display configuration sections with their values.
 
         Args:
@@ -193,21 +230,23 @@ class ConfigCommand(ArtifactCommand):
             True if any values were displayed, False otherwise
         """
         has_values = False
+        public_values = config.get(PUBLIC_CONFIG_SECTION, {})
+        private_values = config.get(PRIVATE_CONFIG_SECTION, {})
 
-        if config[PUBLIC_CONFIG_SECTION] or config[PRIVATE_CONFIG_SECTION]:
+        if public_values or private_values:
             click.echo(f'\n{header}:')
             click.echo(f'Path: {path}')
 
-            if config[PUBLIC_CONFIG_SECTION]:
+            if public_values:
                 has_values = True
                 click.echo(f'\n[{PUBLIC_CONFIG_SECTION}]')
-                for key, value in config[PUBLIC_CONFIG_SECTION].items():
+                for key, value in public_values.items():
                     click.echo(f'{key}: {value}')
 
-            if config[PRIVATE_CONFIG_SECTION]:
+            if private_values:
                 has_values = True
                 click.echo(f'\n[{PRIVATE_CONFIG_SECTION}]')
-                for key, value in config[PRIVATE_CONFIG_SECTION].items():
+                for key, value in private_values.items():
                     click.echo(f'{key}: {value}')
 
         return has_values
@@ -232,10 +271,9 @@ class ConfigCommand(ArtifactCommand):
 
             if config_path.exists():
                 config = self._load_config(config_path)
-                if key in config[section]:
-                    del config[section][key]
-                    with open(config_path, 'w') as f:
-                        config.write(f)
+                if key.lower() in config[section]:
+                    del config[section][key.lower()]
+                    self._flush_config(config_path, config)
                     self.log_success(f'Removed {section_type}.{key} from {scope} .murmurrc')
                     return
 
@@ -275,15 +313,14 @@ class ConfigCommand(ArtifactCommand):
             config_path.parent.mkdir(parents=True, exist_ok=True)
 
             # Create new config with default settings
-            config = configparser.ConfigParser()
-            config[PUBLIC_CONFIG_SECTION] = {
-                'index-url': DEFAULT_MURMUR_INDEX_URL,
-                'extra-index-url': ' '.join(DEFAULT_MURMUR_EXTRA_INDEX_URLS),
+            config: MurmurrcConfig = {
+                PUBLIC_CONFIG_SECTION: {
+                    'index-url': DEFAULT_MURMUR_INDEX_URL,
+                    'extra-index-url': ' '.join(DEFAULT_MURMUR_EXTRA_INDEX_URLS),
+                },
+                PRIVATE_CONFIG_SECTION: {},
             }
-            config[PRIVATE_CONFIG_SECTION] = {}
-
-            with open(config_path, 'w') as f:
-                config.write(f)
+            self._flush_config(config_path, config)
 
             message = f'Created {scope} .murmurrc at: {config_path}'
             # Only show alternative if it doesn't exist
@@ -1,18 +1,33 @@
-import configparser
+import contextlib
+import hashlib
 import importlib.metadata
 import importlib.util
+import json
 import logging
+import os
 import subprocess
 import sys
 import sysconfig
+import tempfile
+import time
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
 import click
 import requests
+from packaging.requirements import InvalidRequirement, Requirement
+from packaging.utils import canonicalize_name
+from packaging.version import InvalidVersion, Version
+from requests.adapters import HTTPAdapter
 from requests.exceptions import ConnectionError as RequestsConnectionError, RequestException, Timeout
 
 from ..core.capsule_client import CapsuleClient
+from ..core.murmurrc import load_murmurrc
+from ..core.packaging import normalize_artifact_name
+from ..utils.constants import MUR_CACHE_DIR
 from ..utils.error_handler import MurError
 from ..utils.loading import Spinner
 from .base import ArtifactCommand
@@ -23,6 +38,192 @@ logger = logging.getLogger(__name__)
 PUBLIC_CONFIG_SECTION = 'murmur-nexus'
 PRIVATE_CONFIG_SECTION = 'murmur-private'
 
+# Concurrent registry metadata requests when installing several artifacts
+METADATA_FETCH_WORKERS = 8
+
+# First pip release that can write a JSON report of what `pip install` installed
+PIP_INSTALL_REPORT_VERSION = Version('22.2')
+
+# Seconds a failed metadata lookup is remembered before the registry is asked again
+METADATA_NEGATIVE_TTL = 60
+
+# Seconds a metadata response kept on disk is revalidated instead of fetched in full
+METADATA_DISK_TTL = 24 * 60 * 60
+
+# Failed metadata lookups (404 or request errors), keyed by (index URL, normalized name)
+_unavailable: dict[tuple[str, str], tuple[float, RequestException]] = {}
+
+
+class _MetadataStore:
+    """On-disk cache of registry metadata responses, kept across runs.
+
+    Entries hold the response body with its ETag and Last-Modified validators and
+    expire METADATA_DISK_TTL seconds after they were last stored or revalidated.
+    """
+
+    def __init__(self, cache_dir: Path) -> None:
+        """Initialize the store.
+
+        Args:
+            cache_dir: Directory holding one JSON file per metadata URL
+        """
+        self.cache_dir = cache_dir
+
+    def _path(self, url: str) -> Path:
+        return self.cache_dir / f'{hashlib.sha256(url.encode()).hexdigest()}.json'
+
+    def get(self, url: str) -> Optional[dict]:
+        """Get the cached response for a metadata URL.
+
+        Args:
+            url: Metadata URL
+
+        Returns:
+            Optional[dict]: Entry with 'etag', 'last_modified' and 'body' keys, or None if
+                there is no usable entry
+        """
+        path = self._path(url)
+        try:
+            if time.time() - path.stat().st_mtime > METADATA_DISK_TTL:
+                return None
+            return json.loads(path.read_bytes())
+        except (OSError, ValueError):
+            return None
+
+    def put(self, url: str, etag: Optional[str], last_modified: Optional[str], body: dict) -> None:
+        """Store the response for a metadata URL, restarting its expiry.
+
+        Failures are logged and otherwise ignored, the cache is only an optimization.
+
+        Args:
+            url: Metadata URL
+            etag: ETag header of the response
+            last_modified: Last-Modified header of the response
+            body: Parsed response body
+        """
+        entry = {'etag': etag, 'last_modified': last_modified, 'body': body}
+        tmp_name = None
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            # Write to a unique temporary file so concurrent writers never see a partial entry
+            with tempfile.NamedTemporaryFile(
+                'w', encoding='utf-8', dir=self.cache_dir, suffix='.tmp', delete=False
+            ) as f:
+                tmp_name = f.name
+                json.dump(entry, f)
+            os.replace(tmp_name, self._path(url))
+        except OSError as e:
+            logger.debug(f'Failed to cache metadata for {url}: {e}')
+            if tmp_name:
+                with contextlib.suppress(OSError):
+                    os.unlink(tmp_name)
+
+
+_metadata_store = _MetadataStore(MUR_CACHE_DIR / 'metadata')
+
+
+@lru_cache(maxsize=1)
+def _get_session() -> requests.Session:
+    """Get the keep-alive session used for registry metadata requests.
+
+    Returns:
+        requests.Session: Session with a connection pool sized for the fetch workers
+    """
+    session = requests.Session()
+    http_adapter = HTTPAdapter(pool_connections=16, pool_maxsize=16)
+    session.mount('https://', http_adapter)
+    session.mount('http://', http_adapter)
+    return session
+
+
+@lru_cache(maxsize=512)
+def _fetch_metadata(index_url: str, normalized_name: str) -> dict:
+    """Fetch and parse artifact metadata from the registry, memoized for the process.
+
+    Responses are also kept on disk and revalidated with the registry on later runs.
+
+    Args:
+        index_url: Index URL of the registry
+        normalized_name: Artifact name as used in registry URLs
+
+    Returns:
+        dict: The parsed metadata, shared between callers
+
+    Raises:
+        RequestException: If the request fails or the artifact is not found. A failure is
+            raised again without contacting the registry for METADATA_NEGATIVE_TTL seconds.
+    """
+    key = (index_url, normalized_name)
+    if key in _unavailable:
+        failed_at, error = _unavailable[key]
+        if time.monotonic() - failed_at < METADATA_NEGATIVE_TTL:
+            raise error
+        del _unavailable[key]
+
+    url = f'{index_url}/{normalized_name}/metadata/'
+    cached = _metadata_store.get(url)
+    headers = {}
+    if cached and cached.get('etag'):
+        headers['If-None-Match'] = cached['etag']
+    if cached and cached.get('last_modified'):
+        headers['If-Modified-Since'] = cached['last_modified']
+
+    try:
+        response = _get_session().get(url, headers=headers, timeout=30)
+        if cached and response.status_code == 304:
+            logger.debug(f'Metadata for {normalized_name} not modified, using cached copy')
+            _metadata_store.put(url, cached['etag'], cached['last_modified'], cached['body'])
+            return cached['body']
+
+        response.raise_for_status()
+        metadata = response.json()
+    except RequestException as e:
+        _unavailable[key] = (time.monotonic(), e)
+        raise
+
+    # Responses without validators cannot be revalidated, so there is no point in keeping them
+    etag, last_modified = response.headers.get('ETag'), response.headers.get('Last-Modified')
+    if etag or last_modified:
+        _metadata_store.put(url, etag, last_modified, metadata)
+    return metadata
+
+
+@lru_cache(maxsize=1)
+def _pip_supports_install_report() -> bool:
+    """Check whether the pip used for installs supports `pip install --report`.
+
+    Returns:
+        bool: True if pip is recent enough to write an installation report
+    """
+    try:
+        return Version(importlib.metadata.version('pip')) >= PIP_INSTALL_REPORT_VERSION
+    except (importlib.metadata.PackageNotFoundError, InvalidVersion):
+        return False
+
+
+def _dedupe_requirements(requirement_specs: Iterable[str]) -> list[str]:
+    """Drop requirement specifiers that repeat an earlier one.
+
+    Specifiers are compared in their canonical form, so 'Pydantic >= 2' and
+    'pydantic>=2' count as the same requirement.
+
+    Args:
+        requirement_specs: Requirement specifiers, e.g. from requires_dist
+
+    Returns:
+        list[str]: The first occurrence of each requirement, in order
+    """
+    unique_specs: dict[str, str] = {}
+    for requirement_spec in requirement_specs:
+        try:
+            requirement = Requirement(requirement_spec)
+            requirement.name = canonicalize_name(requirement.name)
+            key = str(requirement)
+        except InvalidRequirement:
+            key = requirement_spec
+        unique_specs.setdefault(key, requirement_spec)
+    return list(unique_specs.values())
+
 
 class InstallArtifactCommand(ArtifactCommand):
     """Handles artifact installation.
@@ -41,6 +242,11 @@ class InstallArtifactCommand(ArtifactCommand):
         super().__init__('install', verbose)
         self.host = host or self._get_host_from_config()
         self.capsule_client = CapsuleClient(base_url=self.host) if self.host else None
+        # Import lines for artifacts/__init__.py, written by _flush_init_file
+        self._pending_imports: dict[str, None] = {}
+        self._artifacts_dir: Path | None = None
+        # The spinner is only worth its thread when someone is watching the terminal
+        self._interactive = sys.stdout.isatty() and not verbose
 
     def _get_host_from_config(self) -> Optional[str]:
         """Get host URL from configuration file.
@@ -52,14 +258,10 @@ class InstallArtifactCommand(ArtifactCommand):
             # Determine which config section to use based on registry type
             section = PRIVATE_CONFIG_SECTION if self.is_private_registry else PUBLIC_CONFIG_SECTION
 
-            config = configparser.ConfigParser()
-            config.read(self.murmurrc_path)
+            config = load_murmurrc(self.murmurrc_path)
 
             # Only look in the appropriate section
-            if section in config and 'host' in config[section]:
-                return config[section]['host']
-
-            return None
+            return config.get(section, {}).get('host')
         except Exception as e:
             logger.debug(f'Failed to read host from config: {e}')
             return None
@@ -67,12 +269,16 @@ class InstallArtifactCommand(ArtifactCommand):
     def _get_murmur_artifacts_dir(self) -> Path:
         """Get the murmur artifacts directory path.
 
+        The directory is created on first use and remembered for the command.
+
         Returns:
             Path: Path to site-artifacts/murmur/artifacts/
         """
-        site_artifacts = Path(sysconfig.get_path('purelib')) / 'murmur' / 'artifacts'
-        site_artifacts.mkdir(parents=True, exist_ok=True)
-        return site_artifacts
+        if self._artifacts_dir is None:
+            site_artifacts = Path(sysconfig.get_path('purelib')) / 'murmur' / 'artifacts'
+            site_artifacts.mkdir(parents=True, exist_ok=True)
+            self._artifacts_dir = site_artifacts
+        return self._artifacts_dir
 
     def _is_artifact_installed(self, artifact_name: str, version: str) -> bool:
         """Check if artifact is already installed with specified version.
@@ -84,35 +290,71 @@ class InstallArtifactCommand(ArtifactCommand):
         Returns:
             bool: True if artifact is installed with matching version
         """
-        try:
-            installed_version = importlib.metadata.version(artifact_name)
-            if version.lower() == 'latest' or version == '':
-                return True
-            return installed_version == version
-        except importlib.metadata.PackageNotFoundError:
+        dist = self._installed_index().get(normalize_artifact_name(artifact_name))
+        if dist is None:
             return False
+        if version.lower() == 'latest' or version == '':
+            return True
+        return dist.version == version
+
+    def _get_artifact_spec(self, artifact_name: str, version: str) -> str:
+        """Get the pip requirement specifier for an artifact.
+
+        Args:
+            artifact_name: Name of the artifact
+            version: Version to install, or 'latest'/'' for the latest version
+
+        Returns:
+            str: The artifact name, pinned to the version when one is given
+        """
+        return artifact_name if version.lower() in ['latest', ''] else f'{artifact_name}=={version}'
 
     def _install_artifact(self, artifact_name: str, version: str) -> None:
         """Install a artifact using pip with configured index URLs or via capsule client."""
-        try:
-            artifact_spec = artifact_name if version.lower() in ['latest', ''] else f'{artifact_name}=={version}'
+        self._install_artifacts([(artifact_name, version)])
+
+    def _install_artifacts(self, artifacts: list[tuple[str, str]]) -> None:
+        """Install artifacts using pip with configured index URLs or via capsule client.
 
+        With pip, artifacts that are already installed are skipped and the rest are
+        installed with a single pip invocation.
+
+        Args:
+            artifacts: (artifact name, version) pairs to install
+        """
+        artifact_names = ', '.join(artifact_name for artifact_name, _ in artifacts)
+        try:
             # Skip installation check when using a host
             if self.host:
-                self._install_via_capsule(artifact_name, artifact_spec)
-            else:
+                for artifact_name, version in artifacts:
+                    self._install_via_capsule(artifact_name, self._get_artifact_spec(artifact_name, version))
+                return
+
+            # Artifacts listed more than once (e.g. a tool shared by agents) are installed once
+            pending: dict[str, str] = {}
+            for artifact_name, version in artifacts:
+                artifact_spec = self._get_artifact_spec(artifact_name, version)
+                if artifact_spec in pending:
+                    continue
                 # Check if artifact is already installed locally
                 if self._is_artifact_installed(artifact_name, version):
                     logger.info(f'Skipping {artifact_spec} - already installed')
-                    return
-                self._install_via_pip(artifact_name, artifact_spec)
+                    continue
+                pending[artifact_spec] = artifact_name
+
+            if pending:
+                self._install_via_pip(
+                    [(artifact_name, artifact_spec) for artifact_spec, artifact_name in pending.items()]
+                )
+                # The environment changed, rescan it on the next lookup
+                self._installed_by_norm = None
 
         except MurError:
             raise
         except Exception as e:
             raise MurError(
                 code=302,
-                message=f'Failed to install {artifact_name}',
+                message=f'Failed to install {artifact_names}',
                 detail='An unexpected error occurred during artifact installation.',
                 original_error=e,
             )
@@ -128,7 +370,7 @@ class InstallArtifactCommand(ArtifactCommand):
         index_url, _ = self._get_index_urls_from_murmurrc(self.murmurrc_path)
         artifact_url = f'{index_url}/{artifact_name}'
 
-        if not self.verbose:
+        if self._interactive:
             with Spinner() as spinner:
                 spinner.start(f'Installing {artifact_spec} via host {self.host}')
                 try:
@@ -213,69 +455,165 @@ class InstallArtifactCommand(ArtifactCommand):
             for warning in warnings:
                 click.echo(click.style(f'  ! {warning}', fg='yellow'))
 
-    def _install_via_pip(self, artifact_name: str, artifact_spec: str) -> None:
-        """Install artifact using pip.
+    def _install_via_pip(self, artifacts: list[tuple[str, str]]) -> None:
+        """Install artifacts using pip.
 
         Args:
-            artifact_name: Name of the artifact
-            artifact_spec: Full artifact specification (may include version)
+            artifacts: (artifact name, artifact specification) pairs to install together
         """
         index_url, extra_index_urls = self._get_index_urls_from_murmurrc(self.murmurrc_path)
+        artifact_specs = ' '.join(artifact_spec for _, artifact_spec in artifacts)
 
-        with Spinner() as spinner:
-            if not self.verbose:
-                spinner.start(f'Installing {artifact_spec}')
-
-            self._handle_artifact_installation(artifact_spec, artifact_name, index_url, extra_index_urls)
+        if self._interactive:
+            with Spinner() as spinner:
+                spinner.start(f'Installing {artifact_specs}')
+                self._handle_artifact_installation(artifacts, index_url, extra_index_urls)
+        else:
+            self._handle_artifact_installation(artifacts, index_url, extra_index_urls)
 
     def _handle_artifact_installation(
-        self, artifact_spec: str, artifact_name: str, index_url: str, extra_index_urls: list[str]
+        self, artifacts: list[tuple[str, str]], index_url: str, extra_index_urls: list[str]
     ) -> None:
         """Handle the artifact installation process."""
         if '.murmur.nexus' in index_url:
-            self._install_nexus_artifact(artifact_spec, artifact_name, index_url, extra_index_urls)
+            self._install_nexus_artifacts(artifacts, index_url, extra_index_urls)
         else:
-            self._private_artifact_command(artifact_spec, index_url)
+            self._private_artifact_command([artifact_spec for _, artifact_spec in artifacts], index_url)
 
-    def _install_nexus_artifact(
-        self, artifact_spec: str, artifact_name: str, index_url: str, extra_index_urls: list[str]
+    def _install_nexus_artifacts(
+        self, artifacts: list[tuple[str, str]], index_url: str, extra_index_urls: list[str]
     ) -> None:
-        """Install a artifact from Murmur Nexus repository."""
+        """Install artifacts from Murmur Nexus repository.
+
+        The artifacts themselves are installed without dependencies in one pip call, then
+        their dependencies are installed in a second one. The dependencies are read from
+        pip's installation report when pip supports it, otherwise from the registry metadata,
+        fetched while the first pip call runs.
+        """
+        artifact_names = [artifact_name for artifact_name, _ in artifacts]
+        if _pip_supports_install_report():
+            installed = self._install_nexus_artifacts_without_deps(artifacts, index_url, with_report=True)
+            dependencies = self._collect_reported_dependencies(installed, artifact_names, index_url)
+        else:
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                dependencies_future = executor.submit(self._collect_dependencies, artifact_names, index_url)
+                self._install_nexus_artifacts_without_deps(artifacts, index_url)
+                dependencies = dependencies_future.result()
+
+        if dependencies:
+            self._dependencies_artifact_command(dependencies, index_url, extra_index_urls)
+
+    def _install_nexus_artifacts_without_deps(
+        self, artifacts: list[tuple[str, str]], index_url: str, with_report: bool = False
+    ) -> list[dict]:
+        """Install artifacts from Murmur Nexus repository, without their dependencies.
+
+        Args:
+            artifacts: (artifact name, artifact specification) pairs to install
+            index_url: Index URL of the registry
+            with_report: Whether to have pip write an installation report
+
+        Returns:
+            list[dict]: The 'install' entries of pip's installation report, empty without a report
+
+        Raises:
+            MurError: If pip fails to install the artifacts
+        """
+        artifact_names = [artifact_name for artifact_name, _ in artifacts]
         try:
-            self._main_artifact_command(artifact_spec, index_url)
+            with tempfile.TemporaryDirectory() as report_dir:
+                report_path = Path(report_dir) / 'report.json' if with_report else None
+                self._main_artifact_command([artifact_spec for _, artifact_spec in artifacts], index_url, report_path)
+                if report_path is None:
+                    return []
+                return json.loads(report_path.read_text(encoding='utf-8')).get('install', [])
         except subprocess.CalledProcessError as e:
-            if 'Connection refused' in str(e) or 'Could not find a version' in str(e):
+            pip_error = f'{e}\n{e.stderr or ""}'
+            if 'Connection refused' in pip_error or 'Could not find a version' in pip_error:
                 raise MurError(
                     code=806,
-                    message=f'Failed to connect to artifact registry for {artifact_name}',
+                    message=f'Failed to connect to artifact registry for {", ".join(artifact_names)}',
                     detail='Could not establish connection to the artifact registry. Please check your network connection and registry URL.',
                     original_error=e,
                 )
             raise MurError(
                 code=307,
-                message=f'Failed to install {artifact_name}',
+                message=f'Failed to install {", ".join(artifact_names)}',
                 detail='The artifact installation process failed.',
                 original_error=e,
             )
 
-        self._process_artifact_metadata(artifact_name, index_url, extra_index_urls)
+    def _collect_reported_dependencies(
+        self, installed: list[dict], artifact_names: list[str], index_url: str
+    ) -> list[str]:
+        """Collect the dependencies of artifacts from pip's installation report.
 
-    def _process_artifact_metadata(self, artifact_name: str, index_url: str, extra_index_urls: list[str]) -> None:
-        """Process artifact metadata and install dependencies."""
+        Artifacts pip did not install (e.g. already satisfied) are not in the report, and
+        wheels built from the artifact template carry no Requires-Dist. The dependencies of
+        both come from the registry metadata instead.
+
+        Args:
+            installed: The 'install' entries of pip's installation report
+            artifact_names: Names of the artifacts
+            index_url: Index URL of the registry
+
+        Returns:
+            list[str]: Dependencies of all artifacts, without duplicates, in first-seen order
+        """
+        dependencies: list[str] = []
+        reported_names = set()
+        for item in installed:
+            metadata = item.get('metadata', {})
+            if requires_dist := metadata.get('requires_dist'):
+                reported_names.add(normalize_artifact_name(metadata.get('name', '')))
+                dependencies.extend(requires_dist)
+        logger.debug(f'Dependencies from pip report: {dependencies}')
+
+        if unreported_names := [name for name in artifact_names if normalize_artifact_name(name) not in reported_names]:
+            dependencies.extend(self._collect_dependencies(unreported_names, index_url))
+        return _dedupe_requirements(dependencies)
+
+    def _collect_dependencies(self, artifact_names: list[str], index_url: str) -> list[str]:
+        """Collect the dependencies of artifacts from their registry metadata.
+
+        Args:
+            artifact_names: Names of the artifacts
+            index_url: Index URL of the registry
+
+        Returns:
+            list[str]: Dependencies of all artifacts, without duplicates, in first-seen order
+        """
+        # Metadata is fetched concurrently; shared dependencies are passed to pip once
+        with ThreadPoolExecutor(max_workers=min(METADATA_FETCH_WORKERS, len(artifact_names))) as executor:
+            return _dedupe_requirements(
+                dependency
+                for artifact_dependencies in executor.map(
+                    self._process_artifact_metadata, artifact_names, [index_url] * len(artifact_names)
+                )
+                for dependency in artifact_dependencies
+            )
+
+    def _process_artifact_metadata(self, artifact_name: str, index_url: str) -> list[str]:
+        """Fetch artifact metadata from the registry.
+
+        Args:
+            artifact_name: Name of the artifact
+            index_url: Index URL of the registry
+
+        Returns:
+            list[str]: The artifact's dependencies (requires_dist)
+        """
         try:
             normalized_artifact_name = artifact_name.replace('_', '-')
             logger.debug(f'Checking metadata for {artifact_name} from {index_url}')
             logger.debug(f'{index_url}/{normalized_artifact_name}/metadata')
-            response = requests.get(f'{index_url}/{normalized_artifact_name}/metadata/', timeout=30)
-            response.raise_for_status()
-            artifact_info = response.json()
+            artifact_info = _fetch_metadata(index_url, normalized_artifact_name)
 
             logger.debug(f'Artifact info: {artifact_info}')
 
-            if dependencies := artifact_info.get('requires_dist'):
-                logger.debug(f'Dependencies: {dependencies}')
-                for dep_spec in dependencies:
-                    self._dependencies_artifact_command(dep_spec, index_url, extra_index_urls)
+            dependencies = artifact_info.get('requires_dist') or []
+            logger.debug(f'Dependencies: {dependencies}')
+            return dependencies
 
         except RequestsConnectionError as e:
             raise MurError(
@@ -299,15 +637,16 @@ class InstallArtifactCommand(ArtifactCommand):
                 original_error=e,
             )
 
-    def _main_artifact_command(self, artifact_spec: str, index_url: str) -> None:
+    def _main_artifact_command(
+        self, artifact_specs: list[str], index_url: str, report_path: Optional[Path] = None
+    ) -> None:
         command = [
             sys.executable,
             '-m',
             'pip',
             'install',
             '--no-deps',
-            '--disable-pip-version-check',
-            artifact_spec,
+            *artifact_specs,
             '--index-url',
             index_url,
         ]
@@ -315,16 +654,20 @@ class InstallArtifactCommand(ArtifactCommand):
         if not self.verbose:
             command.append('--quiet')
 
-        subprocess.check_call(command)  # nosec B603
+        if report_path is not None:
+            command.extend(['--report', str(report_path)])
+
+        self._run_pip(command)
 
-    def _dependencies_artifact_command(self, artifact_spec: str, index_url: str, extra_index_urls: list[str]) -> None:
+    def _dependencies_artifact_command(
+        self, artifact_specs: list[str], index_url: str, extra_index_urls: list[str]
+    ) -> None:
         command = [
             sys.executable,
             '-m',
             'pip',
             'install',
-            '--disable-pip-version-check',
-            artifact_spec,
+            *artifact_specs,
             '--index-url',
             extra_index_urls[0],
             '--extra-index-url',
@@ -339,16 +682,15 @@ class InstallArtifactCommand(ArtifactCommand):
             for url in extra_index_urls[1:]:
                 command.extend(['--extra-index-url', url])
 
-        subprocess.check_call(command)  # nosec B603
+        self._run_pip(command)
 
-    def _private_artifact_command(self, artifact_spec: str, index_url: str) -> None:
+    def _private_artifact_command(self, artifact_specs: list[str], index_url: str) -> None:
         command = [
             sys.executable,
             '-m',
             'pip',
             'install',
-            '--disable-pip-version-check',
-            artifact_spec,
+            *artifact_specs,
             '--index-url',
             index_url,
         ]
@@ -356,7 +698,7 @@ class InstallArtifactCommand(ArtifactCommand):
         if not self.verbose:
             command.append('--quiet')
 
-        subprocess.check_call(command)  # nosec B603
+        self._run_pip(command)
 
     def _murmur_must_be_installed(self) -> None:
         """Check if the main murmur artifact is installed.
@@ -373,48 +715,73 @@ class InstallArtifactCommand(ArtifactCommand):
             )
 
     def _update_init_file(self, artifact_name: str) -> None:
-        """Update __init__.py file with import statement.
+        """Queue the import statement of an installed artifact for __init__.py.
 
-        Updates or creates the __init__.py file in the artifacts directory
-        with an import statement for the installed artifact.
+        The import is written to the __init__.py file in the artifacts directory
+        by the next call to `_flush_init_file`.
 
         Args:
             artifact_name (str): Name of the artifact to import
         """
-        init_path = self._get_murmur_artifacts_dir() / '__init__.py'
-
         artifact_name_pep8 = artifact_name.lower().replace('-', '_')
 
-        import_line = f'from .{artifact_name_pep8}.main import {artifact_name_pep8}'
+        self._pending_imports[f'from .{artifact_name_pep8}.main import {artifact_name_pep8}'] = None
+
+    def _flush_init_file(self) -> None:
+        """Write queued import statements to __init__.py.
 
-        # Create file if it doesn't exist
-        if not init_path.exists():
-            init_path.write_text(import_line + '\n')
+        Updates or creates the __init__.py file in the artifacts directory with one
+        read and at most one write, appending imports that are not already present.
+        """
+        if not self._pending_imports:
             return
 
-        # Check if import already exists and ensure proper line endings
-        current_content = init_path.read_text()
-        if not current_content.endswith('\n'):
+        init_path = self._get_murmur_artifacts_dir() / '__init__.py'
+
+        # Check which imports already exist and ensure proper line endings
+        current_content = init_path.read_text() if init_path.exists() else ''
+        if current_content and not current_content.endswith('\n'):
             current_content += '\n'
 
-        if import_line not in current_content:
-            with open(init_path, 'w') as f:
-                f.write(current_content + import_line + '\n')
+        current_lines = set(current_content.splitlines())
+        new_lines = [import_line for import_line in self._pending_imports if import_line not in current_lines]
+        self._pending_imports.clear()
+
+        if new_lines or not init_path.exists():
+            init_path.write_text(current_content + ''.join(f'{import_line}\n' for import_line in new_lines))
+
+    def _iter_artifacts(self, artifacts: list[dict]) -> Iterator[dict]:
+        """Walk manifest artifacts depth-first, yielding each agent before its tools.
+
+        Args:
+            artifacts (list[dict]): List of artifacts from yaml manifest
+
+        Yields:
+            dict: Each artifact entry, including nested tools
+        """
+        for artifact in artifacts:
+            yield artifact
+            if tools := artifact.get('tools', []):
+                yield from self._iter_artifacts(tools)
 
     def _install_artifact_group(self, artifacts: list[dict]) -> None:
         """Install a group of artifacts.
 
+        Agents and their tools are collected first so that pip installs them together.
+
         Args:
             artifacts (list[dict]): List of artifacts to install from yaml manifest
         """
-        for artifact in artifacts:
-            self._install_artifact(artifact['name'], artifact['version'])
-            # Update __init__.py file
-            self._update_init_file(artifact['name'])
-
-            # Also install tools if this is an agent
-            if tools := artifact.get('tools', []):
-                self._install_artifact_group(tools)
+        # Artifacts shared by several agents are installed and imported once
+        all_artifacts = list(
+            dict.fromkeys((artifact['name'], artifact['version']) for artifact in self._iter_artifacts(artifacts))
+        )
+        self._install_artifacts(all_artifacts)
+
+        # Update __init__.py file
+        for artifact_name, _ in all_artifacts:
+            self._update_init_file(artifact_name)
+        self._flush_init_file()
 
     def _install_single_artifact(self, artifact_name: str) -> None:
         """Install a single artifact.
@@ -434,6 +801,7 @@ class InstallArtifactCommand(ArtifactCommand):
             # Install the artifact with latest version
             self._install_artifact(artifact_name, 'latest')
             self._update_init_file(artifact_name)
+            self._flush_init_file()
 
             self.log_success(f"Successfully installed artifact '{artifact_name}'")
 
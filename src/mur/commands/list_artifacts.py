@@ -1,10 +1,10 @@
-import configparser
 import logging
 from typing import Optional, TypedDict
 
 import click
 
 from ..core.capsule_client import CapsuleClient
+from ..core.murmurrc import load_murmurrc
 from ..utils.error_handler import MurError
 from .base import ArtifactCommand
 
@@ -51,14 +51,10 @@ class ListArtifactCommand(ArtifactCommand):
             # Determine which config section to use based on registry type
             section = PRIVATE_CONFIG_SECTION if self.is_private_registry else PUBLIC_CONFIG_SECTION
 
-            config = configparser.ConfigParser()
-            config.read(self.murmurrc_path)
+            config = load_murmurrc(self.murmurrc_path)
 
             # Only look in the appropriate section
-            if section in config and 'host' in config[section]:
-                return config[section]['host']
-
-            return None
+            return config.get(section, {}).get('host')
         except Exception as e:
             logger.debug(f'Failed to read host from config: {e}')
             return None
@@ -1,12 +1,15 @@
+import io
 import logging
-from typing import Literal
+from typing import TYPE_CHECKING, Literal
 
 import click
-from ruamel.yaml import YAML
 
 from ..utils.error_handler import MurError
 from .base import ArtifactCommand
 
+if TYPE_CHECKING:
+    from ruamel.yaml import YAML
+
 logger = logging.getLogger(__name__)
 
 
@@ -27,17 +30,20 @@ class NewArtifactCommand(ArtifactCommand):
         """
         self.verbose = verbose
         self.current_dir = self.get_current_dir()
-        self.yaml = self._configure_yaml()
         self.artifact_type = artifact_type
         self.name = name
         super().__init__(self.artifact_type, verbose)
 
-    def _configure_yaml(self) -> YAML:
+    def _configure_yaml(self) -> 'YAML':
         """Configure YAML parser settings.
 
+        ruamel.yaml is imported here so that other commands do not pay for it at startup.
+
         Returns:
             YAML: Configured YAML parser with specific formatting settings.
         """
+        from ruamel.yaml import YAML
+
         yaml = YAML()
         yaml.default_flow_style = False
         yaml.explicit_start = False
@@ -72,8 +78,9 @@ class NewArtifactCommand(ArtifactCommand):
         }
 
         try:
-            with open(build_manifest, 'w') as f:
-                self.yaml.dump(template, f)
+            buf = io.StringIO()
+            self.yaml.dump(template, buf)
+            build_manifest.write_text(buf.getvalue(), encoding='utf-8')
             if self.verbose:
                 logger.info(f'Created murmur-build.yaml with {self.artifact_type} template')
             logger.debug(f'Created build configuration at {build_manifest}')
@@ -97,8 +104,7 @@ class NewArtifactCommand(ArtifactCommand):
         template += '\n'
         template += f'{variable_name} = ActivateAgent("{variable_name}")\n'
         try:
-            with open(main_file, 'w') as f:
-                f.write(template)
+            main_file.write_text(template, encoding='utf-8')
             if self.verbose:
                 logger.debug('Created src/main.py template')
         except Exception as e:
@@ -5,6 +5,7 @@ import click
 
 from ..core.config import ConfigManager
 from ..core.packaging import normalize_artifact_name
+from ..utils.constants import VALID_ARTIFACT_TYPES
 from ..utils.error_handler import MurError
 from .base import ArtifactCommand
 
@@ -42,7 +43,7 @@ class PublishCommand(ArtifactCommand):
             except MurError as e:
                 e.handle()
 
-            if self.artifact_type not in ['agent', 'tool']:
+            if self.artifact_type not in VALID_ARTIFACT_TYPES:
                 raise MurError(
                     code=207,
                     message=f"Invalid artifact type '{self.artifact_type}' in murmur.yaml",
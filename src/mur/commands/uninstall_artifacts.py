@@ -1,9 +1,11 @@
-import configparser
+import contextlib
 import importlib.util
-import json
 import logging
+import os
+import re
 import subprocess
 import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
@@ -13,6 +15,7 @@ from mur.commands.base import ArtifactCommand
 from mur.utils.error_handler import MessageType, MurError
 
 from ..core.capsule_client import CapsuleClient
+from ..core.murmurrc import load_murmurrc
 from ..core.packaging import normalize_artifact_name
 from ..utils.loading import Spinner
 
@@ -23,6 +26,21 @@ PUBLIC_CONFIG_SECTION = 'murmur-nexus'
 PRIVATE_CONFIG_SECTION = 'murmur-private'
 
 
+@lru_cache(maxsize=1)
+def _murmur_namespace_locations() -> tuple[Path, ...]:
+    """Get the directories making up the murmur namespace package.
+
+    The sys.path scan is done once per process.
+
+    Returns:
+        tuple[Path, ...]: Namespace locations, empty if murmur cannot be found
+    """
+    spec = importlib.util.find_spec('murmur')
+    if spec is None or not spec.submodule_search_locations:
+        return ()
+    return tuple(Path(location) for location in spec.submodule_search_locations)
+
+
 class UninstallArtifactCommand(ArtifactCommand):
     """Handles artifact uninstallation.
 
@@ -43,6 +61,7 @@ class UninstallArtifactCommand(ArtifactCommand):
         self.artifact_name = artifact_name
         self.host = host or self._get_host_from_config()
         self.capsule_client = CapsuleClient(base_url=self.host) if self.host else None
+        self._init_path: Path | None = None
 
     def _get_host_from_config(self) -> Optional[str]:
         """Get host URL from configuration file.
@@ -54,42 +73,19 @@ class UninstallArtifactCommand(ArtifactCommand):
             # Determine which config section to use based on registry type
             section = PRIVATE_CONFIG_SECTION if self.is_private_registry else PUBLIC_CONFIG_SECTION
 
-            config = configparser.ConfigParser()
-            config.read(self.murmurrc_path)
+            config = load_murmurrc(self.murmurrc_path)
 
             # Only look in the appropriate section
-            if section in config and 'host' in config[section]:
-                return config[section]['host']
-
-            return None
+            return config.get(section, {}).get('host')
         except Exception as e:
             logger.debug(f'Failed to read host from config: {e}')
             return None
 
-    def _get_installed_artifacts(self) -> list[dict[str, str]]:
-        """Get list of installed artifacts from pip.
-
-        Returns:
-            list[dict[str, str]]: List of installed artifacts with their details
-
-        Raises:
-            MurError: If artifact check fails
-        """
-        check_command = [sys.executable, '-m', 'pip', 'list', '--format=json']
-        try:
-            result = subprocess.run(check_command, capture_output=True, text=True)  # nosec B603
-            if result.returncode != 0:
-                raise MurError(code=309, message='Failed to check artifact status', original_error=result.stderr)
-            return json.loads(result.stdout)
-        except json.JSONDecodeError as e:
-            raise MurError(code=309, message='Failed to parse pip output', original_error=str(e))
-
-    def _find_installed_artifact(self, artifact_name: str, artifacts: list[dict[str, str]]) -> str | None:
+    def _find_installed_artifact(self, artifact_name: str) -> str | None:
         """Find actual installed artifact name.
 
         Args:
             artifact_name: artifact name to search for
-            artifacts: List of installed artifacts
 
         Returns:
             str | None: Actual installed artifact name if found, None otherwise
@@ -98,10 +94,25 @@ class UninstallArtifactCommand(ArtifactCommand):
         if self.verbose:
             logger.debug(f'Looking for normalized name: {normalized_name}')
 
-        for pkg in artifacts:
-            if normalize_artifact_name(pkg['name']) == normalized_name:
-                return pkg['name']
-        return None
+        dist = self._installed_index().get(normalized_name)
+        return dist.metadata['Name'] if dist else None
+
+    def _find_installed_artifacts(self, artifact_names: list[str]) -> list[str]:
+        """Find the installed names of the given artifacts, skipping those not installed.
+
+        Args:
+            artifact_names: artifact names to search for
+
+        Returns:
+            list[str]: Installed artifact names, deduplicated and in the given order
+        """
+        installed_names: dict[str, None] = {}
+        for artifact_name in artifact_names:
+            if installed_name := self._find_installed_artifact(artifact_name):
+                installed_names[installed_name] = None
+            elif self.verbose:
+                logger.info(f'artifact {artifact_name} is not installed')
+        return list(installed_names)
 
     def _uninstall_artifact(self, artifact_name: str) -> None:
         """Uninstall a artifact using pip or capsule client.
@@ -112,39 +123,50 @@ class UninstallArtifactCommand(ArtifactCommand):
         Raises:
             MurError: If artifact check or uninstallation fails.
         """
-        try:
-            # When using a host, use capsule client for uninstallation
-            if self.host:
-                self._uninstall_via_capsule(artifact_name)
-                return
+        # When using a host, use capsule client for uninstallation
+        if self.host:
+            self._uninstall_via_capsule(artifact_name)
+            return
 
-            artifacts = self._get_installed_artifacts()
-            if self.verbose:
-                logger.debug(f'Found installed artifacts: {[p["name"] for p in artifacts]}')
+        self._uninstall_via_pip([artifact_name])
 
-            artifact_to_uninstall = self._find_installed_artifact(artifact_name, artifacts)
-            if not artifact_to_uninstall:
-                if self.verbose:
-                    logger.info(f'artifact {artifact_name} is not installed')
+    def _uninstall_via_pip(self, artifact_names: list[str]) -> None:
+        """Uninstall artifacts using pip.
+
+        Artifacts that are not installed are skipped and the rest are removed with a
+        single pip invocation.
+
+        Args:
+            artifact_names: Names of the artifacts to uninstall.
+
+        Raises:
+            MurError: If uninstallation fails.
+        """
+        try:
+            artifacts_to_uninstall = self._find_installed_artifacts(artifact_names)
+            if not artifacts_to_uninstall:
                 return
 
+            installed_names = ', '.join(artifacts_to_uninstall)
             if self.verbose:
-                logger.info(f'Uninstalling {artifact_to_uninstall}...')
+                logger.info(f'Uninstalling {installed_names}...')
 
-            uninstall_command = [sys.executable, '-m', 'pip', 'uninstall', '-y', artifact_to_uninstall]
-            result = subprocess.run(uninstall_command, capture_output=True, text=True)  # nosec B603
-
-            if result.returncode != 0:
-                raise MurError(
-                    code=309, message=f'Failed to uninstall {artifact_to_uninstall}', original_error=result.stderr
-                )
+            uninstall_command = [sys.executable, '-m', 'pip', 'uninstall', '-y', *artifacts_to_uninstall]
+            try:
+                self._run_pip(uninstall_command)
+            except subprocess.CalledProcessError as e:
+                raise MurError(code=309, message=f'Failed to uninstall {installed_names}', original_error=e.stderr)
+            for artifact_to_uninstall in artifacts_to_uninstall:
+                self._installed_index().pop(normalize_artifact_name(artifact_to_uninstall), None)
 
             if self.verbose:
-                logger.info(f'Successfully uninstalled {artifact_to_uninstall}')
+                logger.info(f'Successfully uninstalled {installed_names}')
 
         except Exception as e:
             if not isinstance(e, MurError):
-                raise MurError(code=309, message=f'Failed to process {artifact_name}', original_error=str(e))
+                raise MurError(
+                    code=309, message=f'Failed to process {", ".join(artifact_names)}', original_error=str(e)
+                )
             raise
 
     def _uninstall_via_capsule(self, artifact_name: str) -> None:
@@ -220,48 +242,75 @@ class UninstallArtifactCommand(ArtifactCommand):
             for warning in warnings:
                 click.echo(click.style(f'  ! {warning}', fg='yellow'))
 
-    def _remove_from_init_file(self, artifact_name: str) -> None:
-        """Remove artifact import from artifacts/__init__.py if it exists.
+    def _get_init_path(self) -> Path:
+        """Get the artifacts/__init__.py file of the murmur namespace.
 
-        Args:
-            artifact_name (str): Name of the artifact whose import should be removed.
+        The lookup is done once and remembered for the command.
+
+        Returns:
+            Path: The first artifacts/__init__.py found in the namespace locations
+
+        Raises:
+            MurError: If the namespace or the init file cannot be found
         """
-        try:
-            # Get the path to the namespace artifact
-            spec = importlib.util.find_spec('murmur')
-            if spec is None or not spec.submodule_search_locations:
-                raise MurError(code=211, message='Could not locate murmur namespace', type=MessageType.WARNING)
-
-            # Find first valid init file in namespace locations
-            init_path = None
-            for location in spec.submodule_search_locations:
-                if self.verbose:
-                    logger.info(f'Checking murmur namespace location for artifacts: {location}')
-                path = Path(location) / 'artifacts' / '__init__.py'
-                if path.exists():
-                    init_path = path
-                    break
+        if self._init_path is not None:
+            return self._init_path
 
-            if not init_path:
-                raise MurError(
-                    code=201,
-                    message='Could not find artifacts/__init__.py in murmur namespace locations',
-                    type=MessageType.WARNING,
-                )
+        # Get the path to the namespace artifact
+        locations = _murmur_namespace_locations()
+        if not locations:
+            raise MurError(code=211, message='Could not locate murmur namespace', type=MessageType.WARNING)
 
+        # Find first valid init file in namespace locations
+        for location in locations:
             if self.verbose:
-                logger.info(f'Removing import from {init_path}')
+                logger.info(f'Checking murmur namespace location for artifacts: {location}')
+            path = location / 'artifacts' / '__init__.py'
+            if path.exists():
+                self._init_path = path
+                return path
+
+        raise MurError(
+            code=201,
+            message='Could not find artifacts/__init__.py in murmur namespace locations',
+            type=MessageType.WARNING,
+        )
+
+    def _remove_from_init_file(self, artifact_names: list[str]) -> None:
+        """Remove artifact imports from artifacts/__init__.py if it exists.
 
-            # Normalize artifact name to lowercase and replace hyphens with underscores
-            artifact_name_pep8 = artifact_name.lower().replace('-', '_')
-            artifact_prefix = f'from .{artifact_name_pep8}.'
+        Args:
+            artifact_names (list[str]): Names of the artifacts whose imports should be removed.
+        """
+        # An empty alternation would match the imports of every artifact
+        if not artifact_names:
+            return
+
+        try:
+            init_path = self._get_init_path()
 
-            with open(init_path) as f:
-                lines = f.readlines()
+            if self.verbose:
+                logger.info(f'Removing imports from {init_path}')
 
-            with open(init_path, 'w') as f:
-                # Keep lines that don't start with imports from this artifact
-                f.writelines(line for line in lines if not line.strip().startswith(artifact_prefix))
+            # Normalize artifact names to lowercase and replace hyphens with underscores
+            module_names = b'|'.join(
+                re.escape(artifact_name.lower().replace('-', '_').encode()) for artifact_name in artifact_names
+            )
+            # Whole import lines from any of these artifacts, matched in one pass over the file bytes
+            import_lines = re.compile(rb'(?m)^[ \t]*from \.(?:' + module_names + rb')\.[^\n]*(?:\n|\Z)')
+
+            content = init_path.read_bytes()
+            kept_content = import_lines.sub(b'', content)
+            if len(kept_content) != len(content):
+                # Replace the file in one step so an interrupted uninstall never leaves it truncated
+                tmp_path = init_path.with_name(f'{init_path.name}.tmp')
+                try:
+                    tmp_path.write_bytes(kept_content)
+                    os.replace(tmp_path, init_path)
+                except BaseException:
+                    with contextlib.suppress(FileNotFoundError):
+                        tmp_path.unlink()
+                    raise
 
         except Exception as e:
             raise MurError(
@@ -272,28 +321,52 @@ class UninstallArtifactCommand(ArtifactCommand):
         """Uninstall all artifacts specified in murmur.yaml."""
         try:
             manifest = self._load_murmur_yaml_from_current_dir()
-            artifacts = []
 
             # Collect all artifacts from the manifest
-            if agents := manifest.get('agents', []):
-                artifacts.extend(agents)
-
-            if tools := manifest.get('tools', []):
-                artifacts.extend(tools)
-
-            # Uninstall all artifacts
-            for artifact in artifacts:
-                try:
-                    if self.verbose:
-                        logger.debug(f'Uninstalling artifact: {artifact["name"]}')
-                    self._uninstall_single_artifact(artifact['name'])
-                except Exception as e:
-                    logger.warning(f'Failed to uninstall artifact {artifact["name"]}: {e}')
+            artifacts = [*(manifest.get('agents') or []), *(manifest.get('tools') or [])]
+            artifact_names = [artifact['name'] for artifact in artifacts]
+
+            if self.host or not self._uninstall_batch(artifact_names):
+                # The host uninstalls one artifact per request, and a failed pip batch is retried per artifact
+                for artifact_name in artifact_names:
+                    try:
+                        if self.verbose:
+                            logger.debug(f'Uninstalling artifact: {artifact_name}')
+                        self._uninstall_single_artifact(artifact_name)
+                    except Exception as e:
+                        logger.warning(f'Failed to uninstall artifact {artifact_name}: {e}')
 
             click.echo(click.style('Successfully uninstalled all artifacts from manifest', fg='green'))
         except Exception as e:
             raise MurError(code=309, message='Failed to uninstall artifacts from manifest', original_error=e)
 
+    def _uninstall_batch(self, artifact_names: list[str]) -> bool:
+        """Uninstall artifacts with one pip call, then clean up their imports.
+
+        Args:
+            artifact_names (list[str]): Names of the artifacts to uninstall.
+
+        Returns:
+            bool: False if pip failed and the artifacts should be uninstalled one by one,
+                so a single failing artifact does not block the others.
+        """
+        try:
+            self._uninstall_via_pip(artifact_names)
+        except MurError as e:
+            logger.debug(f'Batch uninstall failed, retrying artifacts one by one: {e}')
+            # pip may have removed some of the artifacts before failing
+            self._installed_by_norm = None
+            return False
+
+        try:
+            self._remove_from_init_file(artifact_names)
+        except Exception as e:
+            logger.warning(f'Failed to uninstall artifacts {", ".join(artifact_names)}: {e}')
+        else:
+            for artifact_name in artifact_names:
+                self.log_success(f'Successfully uninstalled {artifact_name}')
+        return True
+
     def _uninstall_single_artifact(self, artifact_name: str) -> None:
         """Handle uninstallation of a single artifact."""
         try:
@@ -302,7 +375,7 @@ class UninstallArtifactCommand(ArtifactCommand):
                 logger.debug(f'Attempting to uninstall artifact as provided: {artifact_name}')
 
             self._uninstall_artifact(artifact_name)
-            self._remove_from_init_file(artifact_name)
+            self._remove_from_init_file([artifact_name])
 
             # Only show success message if uninstallation completed without errors
             self.log_success(f'Successfully uninstalled {artifact_name}')
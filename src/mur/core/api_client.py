@@ -1,16 +1,73 @@
+import atexit
 import logging
-from typing import Any, Generic, Optional, TypeVar, Union
+from functools import cache
+from typing import TYPE_CHECKING, Any, Generic, Optional, TypeVar, Union, cast
 
 import requests
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
+from pydantic_core import from_json
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from ..utils.constants import DEFAULT_TIMEOUT, MURMUR_SERVER_URL
 from ..utils.error_handler import MurError
 
+if TYPE_CHECKING:
+    from typing_extensions import Self
+
 logger = logging.getLogger(__name__)
 
 T = TypeVar('T', bound=Any)  # Changed from BaseModel to Any to support List[Model]
 
+# Retries for connection failures and transient gateway errors. Only methods without a
+# body are resent after a response: POSTs must not run twice, and PUT uploads stream a
+# file that cannot be rewound once it has been sent.
+API_RETRY = Retry(
+    total=3,
+    backoff_factor=0.2,
+    status_forcelist=[502, 503, 504],
+    allowed_methods=frozenset({'GET', 'HEAD', 'OPTIONS', 'DELETE'}),
+    raise_on_status=False,
+)
+
+# Content type of most API requests, set on the session instead of per request
+DEFAULT_CONTENT_TYPE = 'application/json'
+
+
+@cache
+def _get_session(base_url: str) -> requests.Session:
+    """Get the session shared by all clients of a base URL.
+
+    Commands create their own ApiClient, so keeping the session at module level
+    lets them reuse the pooled connections for the lifetime of the process.
+
+    Args:
+        base_url: Base URL of the API the session talks to
+
+    Returns:
+        requests.Session: Session with retrying connection pools mounted
+    """
+    session = requests.Session()
+    session.headers['Content-Type'] = DEFAULT_CONTENT_TYPE
+    http_adapter = HTTPAdapter(pool_connections=10, pool_maxsize=10, max_retries=API_RETRY)
+    session.mount('https://', http_adapter)
+    session.mount('http://', http_adapter)
+    atexit.register(session.close)
+    return session
+
+
+@cache
+def _type_adapter(response_model: Any) -> TypeAdapter:
+    """Get the validator for a response type that is not a model class, such as list[Account].
+
+    Args:
+        response_model: Response type to validate
+
+    Returns:
+        TypeAdapter: Adapter built once per type and reused across requests
+    """
+    return TypeAdapter(response_model)
+
 
 class ApiResponse(BaseModel, Generic[T]):
     """Model for standardized API responses.
@@ -33,6 +90,7 @@ class ApiClient:
     Attributes:
         base_url (str): Base URL for the Murmur API
         verbose (bool): Flag for enabling verbose logging
+        session (requests.Session): Session shared by all clients of the base URL to keep connections alive
     """
 
     def __init__(self, base_url: str = MURMUR_SERVER_URL.rstrip('/'), verbose: bool = False) -> None:
@@ -47,10 +105,30 @@ class ApiClient:
         """
         self.base_url = base_url
         self.verbose = verbose
+        # Derived from the base URL once instead of on every request
+        self._url_prefix = f'{base_url}/'
+        self._verify_ssl = base_url.startswith('https://')
+
+        self.session = _get_session(base_url)
 
         if verbose:
             logger.setLevel(logging.DEBUG)
 
+    def close(self) -> None:
+        """Release the client.
+
+        The session is shared by every client of the same base URL, so it is left
+        open for them and closed at interpreter exit instead.
+        """
+
+    def __enter__(self) -> 'Self':
+        """Allows the client to be used as a context manager."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Closes the client when exiting the context."""
+        self.close()
+
     def request(
         self,
         method: str,
@@ -59,7 +137,7 @@ class ApiClient:
         response_model: Optional[type[T]] = None,
         query_params: Optional[dict[str, Any]] = None,
         headers: Optional[dict[str, str]] = None,
-        content_type: str = 'application/json',
+        content_type: str = DEFAULT_CONTENT_TYPE,
     ) -> ApiResponse[T]:
         """Make an HTTP request to the API.
 
@@ -79,23 +157,21 @@ class ApiClient:
             MurError: If the API request fails
         """
         try:
-            url = f'{self.base_url}/{endpoint.lstrip("/")}'
+            url = self._url_prefix + endpoint.lstrip('/')
             request_headers = self._prepare_headers(headers, content_type)
-            verify_ssl = self.base_url.startswith('https://')
-            data, json_data = self._prepare_request_data(payload, content_type)
+            data = self._prepare_request_data(payload, content_type)
 
             if self.verbose:
                 logger.debug(f'{method.upper()} request to {endpoint}')
 
-            response = requests.request(
+            response = self.session.request(
                 method=method.lower(),
                 url=url,
                 params=query_params,
                 headers=request_headers,
                 data=data,
-                json=json_data,
                 timeout=DEFAULT_TIMEOUT,
-                verify=verify_ssl,
+                verify=self._verify_ssl,
             )
 
             if self.verbose:
@@ -112,44 +188,45 @@ class ApiClient:
                 original_error=e,
             )
 
-    def _prepare_headers(self, headers: Optional[dict[str, str]], content_type: str) -> dict[str, str]:
+    def _prepare_headers(self, headers: Optional[dict[str, str]], content_type: str) -> Optional[dict[str, str]]:
         """Prepare request headers.
 
+        The default content type is sent through the session headers, so only
+        per-request differences are returned.
+
         Args:
             headers: Optional custom headers
             content_type: Content type for the request
 
         Returns:
-            dict: Combined headers
+            Optional[dict]: Headers to merge into the session headers, or None if there are none
         """
+        if content_type == DEFAULT_CONTENT_TYPE and not headers:
+            return None
+
         request_headers = {'Content-Type': content_type}
         if headers:
             request_headers.update(headers)
         return request_headers
 
-    def _prepare_request_data(
-        self, payload: Optional[BaseModel], content_type: str
-    ) -> tuple[Optional[dict], Optional[dict]]:
+    def _prepare_request_data(self, payload: Optional[BaseModel], content_type: str) -> Optional[Union[bytes, dict]]:
         """Prepare request data based on content type.
 
+        JSON payloads are serialized by pydantic directly into the request body,
+        skipping the intermediate dict that requests would encode again.
+
         Args:
             payload: Optional request payload
             content_type: Content type for the request
 
         Returns:
-            tuple: (data, json_data) for the request
+            Optional[Union[bytes, dict]]: Request body, or None without a payload
         """
-        data = None
-        json_data = None
-
-        if payload:
-            payload_dict = payload.model_dump(exclude_none=True)
-            if content_type == 'application/json':
-                json_data = payload_dict
-            else:
-                data = payload_dict
-
-        return data, json_data
+        if not payload:
+            return None
+        if content_type == DEFAULT_CONTENT_TYPE:
+            return payload.model_dump_json(exclude_none=True).encode()
+        return payload.model_dump(exclude_none=True)
 
     def _process_response(self, response: requests.Response, response_model: Optional[type[T]]) -> ApiResponse[T]:
         """Process the API response.
@@ -178,19 +255,21 @@ class ApiClient:
         Returns:
             ApiResponse: Standardized response with typed data
         """
+        # Decoded once and reused for raw_data if validation fails
+        response_json = None
         try:
-            response_json = response.json()
+            response_json = from_json(response.content)
 
             # Handle list responses
             if isinstance(response_json, list):
                 return self._parse_list_response(response, response_json, response_model)
 
             # Handle dictionary responses
-            parsed_data = response_model(**response_json)
+            parsed_data = response_model.model_validate(response_json)
             return ApiResponse(status_code=response.status_code, data=parsed_data, raw_data=response_json, error=None)
         except Exception as e:
             logger.debug(f'Failed to parse response data: {e}')
-            raw_data = {} if not response.content else ({} if isinstance(response.json(), list) else response.json())
+            raw_data = response_json if isinstance(response_json, dict) else {}
             return ApiResponse(
                 status_code=response.status_code,
                 raw_data=raw_data,
@@ -212,8 +291,8 @@ class ApiClient:
         """
         # For List[SomeModel] response types
         if hasattr(response_model, '__origin__') and response_model.__origin__ is list:
-            item_model = response_model.__args__[0]
-            parsed_data = [item_model(**item) for item in response_json]
+            # Generic aliases such as list[Account] are hashable, so they can key the adapter cache
+            parsed_data = _type_adapter(cast(Any, response_model)).validate_python(response_json)
             return ApiResponse(
                 status_code=response.status_code,
                 data=parsed_data,
@@ -238,27 +317,19 @@ class ApiClient:
         Returns:
             ApiResponse: Standardized response with typed data
         """
-        try:
-            if response.content:
-                response_data = response.json()
-                return ApiResponse(
-                    status_code=response.status_code,
-                    raw_data=response_data,
-                    error=response.text if response.status_code >= 400 else None,
-                )
+        response_data = {}
+        if response.content:
+            try:
+                response_data = from_json(response.content)
+            except ValueError:
+                # If JSON parsing fails, return empty raw_data
+                pass
 
-            return ApiResponse(
-                status_code=response.status_code,
-                raw_data={},
-                error=response.text if response.status_code >= 400 else None,
-            )
-        except Exception:
-            # If JSON parsing fails, return empty raw_data
-            return ApiResponse(
-                status_code=response.status_code,
-                raw_data={},
-                error=response.text if response.status_code >= 400 else None,
-            )
+        return ApiResponse(
+            status_code=response.status_code,
+            raw_data=response_data if isinstance(response_data, (dict, list)) else {},
+            error=response.text if response.status_code >= 400 else None,
+        )
 
     def post(
         self,
@@ -1,4 +1,5 @@
 import logging
+from functools import lru_cache
 
 import click
 
@@ -393,3 +394,30 @@ class AuthenticationManager:
 
         # Update local config
         self.config = self.config_manager.get_config()
+
+
+def get_auth_manager(verbose: bool = False, base_url: str = MURMUR_SERVER_URL.rstrip('/')) -> AuthenticationManager:
+    """Get the process-wide AuthenticationManager for the given settings.
+
+    Commands and registry adapters share one manager, so the user config and
+    credential cache are only loaded once per process.
+
+    Args:
+        verbose (bool, optional): Enable verbose logging. Defaults to False.
+        base_url (str, optional): Base URL for the registry API.
+            Defaults to MURMUR_SERVER_URL.rstrip('/').
+
+    Returns:
+        AuthenticationManager: Shared instance
+
+    Raises:
+        MurError: If manager creation fails
+    """
+    # Pass the arguments positionally so every call style maps to the same cache key
+    return _get_auth_manager(verbose, base_url)
+
+
+@lru_cache(maxsize=4)
+def _get_auth_manager(verbose: bool, base_url: str) -> AuthenticationManager:
+    """Create the AuthenticationManager cached by get_auth_manager."""
+    return AuthenticationManager.create(verbose=verbose, base_url=base_url)
@@ -0,0 +1,123 @@
+import os
+from functools import lru_cache
+from pathlib import Path
+
+MurmurrcConfig = dict[str, dict[str, str]]
+
+
+def _read_murmurrc(path: Path | str) -> MurmurrcConfig:
+    """Read a .murmurrc file in a single pass.
+
+    Supports the subset of INI syntax that .murmurrc files use: ``[section]``
+    headers, ``key = value`` or ``key: value`` pairs, full-line ``#``/``;``
+    comments and continuation lines for multi-line values such as
+    ``extra-index-url``. Like ConfigParser, a line only continues the previous
+    value when it is indented deeper than that key, and keys are lowercased.
+
+    Args:
+        path: Path to the .murmurrc file
+
+    Returns:
+        MurmurrcConfig: Mapping of section name to its key/value pairs
+    """
+    config: MurmurrcConfig = {}
+    section: dict[str, str] | None = None
+    key: str | None = None
+    indent = 0
+
+    with open(path, encoding='utf-8') as f:
+        for raw_line in f:
+            line = raw_line.strip()
+            if not line or line[0] in '#;':
+                continue
+
+            # Lines indented deeper than the previous key continue its value
+            line_indent = len(raw_line) - len(raw_line.lstrip())
+            if section is not None and key is not None and line_indent > indent:
+                section[key] += f'\n{line}'
+                continue
+            indent = line_indent
+
+            if line[0] == '[' and line[-1] == ']':
+                section = config.setdefault(line[1:-1].strip(), {})
+                key = None
+                continue
+
+            if section is None:
+                continue
+
+            # Split on whichever delimiter comes first; URLs contain ':' after the '='
+            delimiters = [i for i in (line.find('='), line.find(':')) if i != -1]
+            if not delimiters:
+                key = None
+                continue
+
+            split_at = min(delimiters)
+            key = line[:split_at].strip().lower()
+            section[key] = line[split_at + 1 :].strip()
+
+    return config
+
+
+@lru_cache(maxsize=8)
+def _parse_murmurrc(path: str, mtime_ns: int, size: int) -> MurmurrcConfig:
+    """Parse a .murmurrc file.
+
+    The stat signature is part of the cache key so an edited file is parsed again.
+
+    Args:
+        path: Path to the .murmurrc file
+        mtime_ns: Modification time of the file in nanoseconds
+        size: Size of the file in bytes
+
+    Returns:
+        MurmurrcConfig: The parsed configuration
+    """
+    try:
+        return _read_murmurrc(path)
+    except OSError:
+        return {}
+
+
+def load_murmurrc(path: Path | str) -> MurmurrcConfig:
+    """Load a .murmurrc file, reusing the previous parse if the file is unchanged.
+
+    The returned mapping is shared between callers and must be treated as read-only.
+    A missing or unreadable file yields an empty configuration, like ConfigParser.read.
+
+    Args:
+        path: Path to the .murmurrc file
+
+    Returns:
+        MurmurrcConfig: Mapping of section name to its key/value pairs
+    """
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        # Common for the local .murmurrc, skip the cache and the open attempt
+        return {}
+    except OSError:
+        return _parse_murmurrc(str(path), -1, -1)
+    return _parse_murmurrc(str(path), st.st_mtime_ns, st.st_size)
+
+
+def dump_murmurrc(config: MurmurrcConfig) -> str:
+    """Serialize a configuration in the .murmurrc format.
+
+    Produces the same layout as ConfigParser.write: a blank line after each
+    section, ``key = value`` pairs and tab-indented continuation lines.
+
+    Args:
+        config: Mapping of section name to its key/value pairs
+
+    Returns:
+        str: The .murmurrc file content
+    """
+    lines = []
+    for section, values in config.items():
+        lines.append(f'[{section}]\n')
+        for key, value in values.items():
+            value = value.replace('\n', '\n\t')
+            lines.append(f'{key} = {value}\n')
+        lines.append('\n')
+    return ''.join(lines)
@@ -11,9 +11,9 @@ from urllib.parse import urlparse
 from packaging.specifiers import SpecifierSet
 from packaging.utils import is_normalized_name
 from packaging.version import InvalidVersion, Version
-from ruamel.yaml import YAML
 
 from ..utils.error_handler import MurError
+from ..utils.yaml_io import load_yaml_cached
 
 logger = logging.getLogger(__name__)
 
@@ -24,6 +24,12 @@ REQUIRED_BUILD_MANIFEST_FIELDS = REQUIRED_MANIFEST_FIELDS | {
     'metadata',
 }
 
+# Patterns compiled once at import and shared by every validation call
+EMAIL_PATTERN = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+REQUIREMENT_NAME_PATTERN = re.compile(r'^[A-Za-z0-9][-A-Za-z0-9_.]*$')
+ENVIRONMENT_MARKER_PATTERN = re.compile(r'^[\w\s]+ *(?:==|!=) *["\'][^"\']+["\']$')
+NON_ALPHANUMERIC_RUN_PATTERN = re.compile(r'[^a-zA-Z0-9]+')
+
 
 @dataclass
 class ArtifactManifest:
@@ -158,9 +164,8 @@ class ArtifactManifest:
             )
 
         try:
-            yaml = YAML()
-            with open(manifest_file_path) as f:
-                manifest_data = yaml.load(f)
+            # A private copy, __post_init__ adds requires_dist to the metadata
+            manifest_data = load_yaml_cached(manifest_file_path)
         except Exception as e:
             raise MurError(
                 code=204,
@@ -379,13 +384,12 @@ class MetadataValidator:
     @staticmethod
     def validate_author_email(value: str) -> None:
         """Validate email format."""
-        email_pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        if not re.match(email_pattern, value):
+        if not EMAIL_PATTERN.match(value):
             raise MurError(
                 code=207,
                 message='Invalid email format',
                 detail=f'Got value: {value}.',
-                debug_messages=[f'email_pattern: {email_pattern}'],
+                debug_messages=[f'email_pattern: {EMAIL_PATTERN.pattern}'],
             )
 
     @staticmethod
@@ -534,7 +538,7 @@ class MetadataValidator:
             artifact_name = artifact_spec
             version_part = ''
 
-        if not re.match(r'^[A-Za-z0-9][-A-Za-z0-9_.]*$', artifact_name):
+        if not REQUIREMENT_NAME_PATTERN.match(artifact_name):
             raise MurError(code=207, message='Invalid artifact name format', detail=f'Got value: {artifact_name}')
 
         if version_part:
@@ -543,7 +547,7 @@ class MetadataValidator:
     @staticmethod
     def _validate_environment_marker(marker: str) -> None:
         """Validate environment marker part."""
-        if not re.match(r'^[\w\s]+ *(?:==|!=) *["\'][^"\']+["\']$', marker):
+        if not ENVIRONMENT_MARKER_PATTERN.match(marker):
             raise MurError(code=207, message='Invalid environment marker', detail=f'Got value: {marker}')
 
     @staticmethod
@@ -590,12 +594,9 @@ def normalize_artifact_name(project_name: str) -> str:
     Returns:
         str: Normalized artifact name following PEP 8 conventions
     """
-    # Replace invalid characters (including dots) with '_'
-    name = re.sub(r'[^a-zA-Z0-9_]', '_', project_name.replace('-', '_').replace('.', '_'))
-    # Remove any leading underscores or invalid characters
-    name = re.sub(r'^_+', '', name)  # Remove leading underscores
-    # Replace multiple consecutive underscores with a single one
-    name = re.sub(r'__+', '_', name)
+    # Collapse every run of invalid characters (dashes, dots, underscores, ...) into a single '_'
+    # and drop leading underscores
+    name = NON_ALPHANUMERIC_RUN_PATTERN.sub('_', project_name).lstrip('_')
     # Ensure it starts with a valid character
     if not name or not name[0].isalpha():
         name = f'default_{name}'  # Default fallback if name becomes empty or starts with a digit
@@ -15,3 +15,15 @@ DEFAULT_MURMUR_EXTRA_INDEX_URLS = [
 PYPI_USERNAME = os.getenv('PYPI_USERNAME', 'admin')  # local defaults
 PYPI_PASSWORD = os.getenv('PYPI_PASSWORD', 'admin')  # local defaults
 GLOBAL_MURMURRC_PATH = Path.home() / '.murmurrc'
+MUR_CACHE_DIR = Path(os.getenv('XDG_CACHE_HOME') or Path.home() / '.cache') / 'mur'
+
+# Environment for pip subprocesses: no .pyc files for pip's own modules, no prompts, no version check
+PIP_ENV = {
+    **os.environ,
+    'PYTHONDONTWRITEBYTECODE': '1',
+    'PIP_NO_INPUT': '1',
+    'PIP_DISABLE_PIP_VERSION_CHECK': '1',
+}
+
+# Artifact types accepted in build and artifact manifests
+VALID_ARTIFACT_TYPES = frozenset({'agent', 'tool'})
@@ -69,14 +69,14 @@ class ArtifactPublishRequest(BaseModel):
         manifest_dict = manifest.to_dict()
 
         # Ensure required fields are present
-        if 'type' not in manifest_dict:
-            manifest_dict['type'] = manifest.type
+        manifest_dict.setdefault('type', manifest.type)
 
         # Convert dependencies to requires_dist if present
-        if 'dependencies' in manifest_dict and isinstance(manifest_dict['dependencies'], list):
-            manifest_dict['requires_dist'] = manifest_dict.get('dependencies', [])
+        dependencies = manifest_dict.get('dependencies')
+        if isinstance(dependencies, list):
+            manifest_dict['requires_dist'] = dependencies
 
-        return cls(**manifest_dict)
+        return cls.model_validate(manifest_dict)
 
 
 class SignedUrlInfo(BaseModel):
@@ -112,6 +112,3 @@ class Account(BaseModel):
 
 # Update this model to be a list type alias instead of a wrapper
 AccountListResponse = list[Account]
-
-# Resolve forward references
-ArtifactPublishRequest.update_forward_refs()
@@ -0,0 +1,60 @@
+"""YAML reading for manifests that are only read, never written back.
+
+Uses ruamel.yaml's pure-Python safe loader, so documents are parsed under
+YAML 1.2 rules on every machine. It returns plain dicts and lists; use
+ruamel's round-trip mode for files whose formatting must be preserved.
+"""
+
+import copy
+import os
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+
+def load_yaml(path: Path | str) -> Any:
+    """Load a YAML file.
+
+    Args:
+        path: Path to the YAML file
+
+    Returns:
+        Any: The parsed document
+    """
+    from ruamel.yaml import YAML
+
+    with open(path, encoding='utf-8') as f:
+        return YAML(typ='safe', pure=True).load(f)
+
+
+@lru_cache(maxsize=16)
+def _load_yaml_cached(path: str, mtime_ns: int, size: int) -> Any:
+    """Parse a YAML file, memoized on its stat signature.
+
+    Args:
+        path: Path to the YAML file
+        mtime_ns: Modification time of the file in nanoseconds
+        size: Size of the file in bytes
+
+    Returns:
+        Any: The parsed document, shared between callers
+    """
+    return load_yaml(path)
+
+
+def load_yaml_cached(path: Path | str) -> Any:
+    """Load a YAML file, reusing the previous parse if the file is unchanged.
+
+    Callers get their own copy of the document and are free to modify it.
+
+    Args:
+        path: Path to the YAML file
+
+    Returns:
+        Any: The parsed document
+
+    Raises:
+        FileNotFoundError: If the file does not exist
+    """
+    st = os.stat(path)
+    return copy.deepcopy(_load_yaml_cached(str(path), st.st_mtime_ns, st.st_size))
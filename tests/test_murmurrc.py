@@ -0,0 +1,58 @@
+import configparser
+from pathlib import Path
+
+import pytest
+
+from mur.core.murmurrc import _read_murmurrc, load_murmurrc
+
+
+def _read_with_configparser(path: Path) -> dict[str, dict[str, str]]:
+    parser = configparser.ConfigParser()
+    parser.read(path)
+    return {section: dict(parser[section]) for section in parser.sections()}
+
+
+@pytest.mark.parametrize(
+    'content',
+    [
+        '[murmur-nexus]\nindex-url = https://a\nextra-index-url = https://b\n',
+        '[murmur-nexus]\n  index-url = https://a\n  extra-index-url = https://b\n',
+        '[murmur-nexus]\nindex-url = https://a\nextra-index-url =\n\thttps://b\n\thttps://c\n',
+        '[murmur-nexus]\n  index-url = https://a\n  extra-index-url = https://b\n    https://c\n',
+        '# comment\n[murmur-nexus]\nIndex-URL: https://a\n; comment\n\n[murmur-private]\nindex-url = http://x\n',
+    ],
+)
+def test_read_murmurrc_matches_configparser(tmp_path: Path, content: str) -> None:
+    path = tmp_path / '.murmurrc'
+    path.write_text(content)
+
+    assert _read_murmurrc(path) == _read_with_configparser(path)
+
+
+def test_read_murmurrc_indented_keys_are_separate(tmp_path: Path) -> None:
+    path = tmp_path / '.murmurrc'
+    path.write_text('[murmur-nexus]\n  index-url = https://a\n  extra-index-url = https://b\n')
+
+    assert _read_murmurrc(path) == {'murmur-nexus': {'index-url': 'https://a', 'extra-index-url': 'https://b'}}
+
+
+def test_load_murmurrc_serves_indented_keys_from_cache(tmp_path: Path) -> None:
+    path = tmp_path / '.murmurrc'
+    path.write_text('[murmur-nexus]\n  index-url = https://a\n  extra-index-url = https://b\n')
+
+    first = load_murmurrc(path)
+    assert first == {'murmur-nexus': {'index-url': 'https://a', 'extra-index-url': 'https://b'}}
+    assert load_murmurrc(path) is first
+
+
+def test_load_murmurrc_reparses_edited_file(tmp_path: Path) -> None:
+    path = tmp_path / '.murmurrc'
+    path.write_text('[murmur-nexus]\nindex-url = https://a\n')
+    assert load_murmurrc(path) == {'murmur-nexus': {'index-url': 'https://a'}}
+
+    path.write_text('[murmur-nexus]\n  index-url = https://new\n  extra-index-url = https://b\n')
+    assert load_murmurrc(path) == {'murmur-nexus': {'index-url': 'https://new', 'extra-index-url': 'https://b'}}
+
+
+def test_load_murmurrc_missing_file(tmp_path: Path) -> None:
+    assert load_murmurrc(tmp_path / '.murmurrc') == {}